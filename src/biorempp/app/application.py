@@ -361,6 +361,10 @@ class BioRemPPApplication:
             args_context = parsed_args if "parsed_args" in locals() else None
             error_msg, solution_text = self.error_handler.handle_error(e, args_context)
             self.feedback_manager.error(f"[ERROR] {error_msg}")
+            # Failed database pipelines are grouped; report each of them
+            for failure in getattr(e, "exceptions", ()):
+                database = getattr(failure, "database", type(failure).__name__)
+                self.feedback_manager.error(f"[ERROR] {database}: {failure}")
             if solution_text:
                 self.feedback_manager.info(f"[INFO] {solution_text}")
             sys.exit(1)
@@ -48,6 +48,8 @@ from typing import Any, Dict
 
 from biorempp.commands.base_command import BaseCommand
 from biorempp.pipelines.input_processing import (
+    PipelineContext,
+    raise_pipeline_failures,
     run_biorempp_processing_pipeline,
     run_hadeg_processing_pipeline,
     run_kegg_processing_pipeline,
@@ -110,6 +112,9 @@ class AllDatabasesMergerCommand(BaseCommand):
         "toxcsm": run_toxcsm_processing_pipeline,
     }
 
+    # Databases sharing the BioRemPP merge through a PipelineContext
+    CONTEXT_DATABASES = ("biorempp", "toxcsm")
+
     def validate_specific_input(self, args) -> bool:
         """
         Validate all databases merger specific inputs.
@@ -152,12 +157,20 @@ class AllDatabasesMergerCommand(BaseCommand):
         Dict[str, Any]
             Comprehensive results from all database integration operations:
             {
-                'biorempp': {result_dict or error_info},
-                'hadeg': {result_dict or error_info},
-                'kegg': {result_dict or error_info},
-                'toxcsm': {result_dict or error_info}
+                'biorempp': {result_dict},
+                'hadeg': {result_dict},
+                'kegg': {result_dict},
+                'toxcsm': {result_dict}
             }
 
+        Raises
+        ------
+        ExceptionGroup
+            If any database failed (Python 3.11+), once all databases have
+            been processed. See ``raise_pipeline_failures``.
+        RuntimeError
+            If any database failed (Python < 3.11).
+
         Processing Strategy:
             - Sequential execution through all databases
             - Individual error handling and isolation
@@ -166,9 +179,10 @@ class AllDatabasesMergerCommand(BaseCommand):
             - Result aggregation with success/failure reporting
 
         Error Handling:
-            Individual database failures are captured and logged but do not
-            prevent processing of remaining databases. This ensures maximum
-            data recovery even in partial failure scenarios.
+            Individual database failures are captured and do not prevent
+            processing of remaining databases. This ensures maximum data
+            recovery even in partial failure scenarios. The failures are
+            raised together at the end, each tagged with its database.
 
         Output Files Generated:
             - BioRemPP_Results.txt: Core bioremediation analysis
@@ -183,14 +197,27 @@ class AllDatabasesMergerCommand(BaseCommand):
         """
         self.logger.info("Starting merge with ALL databases")
         results = {}
+        errors = {}
+
+        # Lets the ToxCSM pipeline reuse the BioRemPP merge done before it
+        context = PipelineContext(input_path=args.input)
+
+        # Run ToxCSM right after BioRemPP so that the shared merge is released
+        # before the other databases are processed
+        run_order = sorted(
+            self.MERGE_FUNCTIONS, key=lambda db: db not in self.CONTEXT_DATABASES
+        )
 
         # Execute merge with each database individually
-        for db_name, merge_func in self.MERGE_FUNCTIONS.items():
+        for db_name in run_order:
+            merge_func = self.MERGE_FUNCTIONS[db_name]
             try:
                 self.logger.info(f"Merging with {db_name} database...")
 
                 # Build pipeline kwargs for this database
                 pipeline_kwargs = self._build_pipeline_kwargs(args, db_name)
+                if db_name in self.CONTEXT_DATABASES:
+                    pipeline_kwargs["context"] = context
 
                 # Execute merge function
                 result = merge_func(**pipeline_kwargs)
@@ -199,15 +226,13 @@ class AllDatabasesMergerCommand(BaseCommand):
                 self.logger.info(f"Successfully merged with {db_name} database")
 
             except Exception as e:
-                self.logger.error(f"Failed to merge with {db_name} database: {e}")
-                results[db_name] = {"error": str(e)}
-                # Continue with other databases even if one fails
+                # Raised together below; continue with the other databases
+                errors[db_name] = e
 
-        # Log summary
-        successful_merges = [
-            db for db, result in results.items() if "error" not in result
-        ]
-        failed_merges = [db for db, result in results.items() if "error" in result]
+        # Report results and failures in the declared database order
+        successful_merges = [db for db in self.MERGE_FUNCTIONS if db in results]
+        failed_merges = [db for db in self.MERGE_FUNCTIONS if db in errors]
+        results = {db_name: results[db_name] for db_name in successful_merges}
 
         self.logger.info(
             f"All databases merge completed. "
@@ -218,6 +243,7 @@ class AllDatabasesMergerCommand(BaseCommand):
         if failed_merges:
             self.logger.warning(f"Failed merges: {', '.join(failed_merges)}")
 
+        raise_pipeline_failures([(db, errors[db]) for db in failed_merges])
         return results
 
     def _build_pipeline_kwargs(self, args, database_name: str) -> Dict[str, Any]:
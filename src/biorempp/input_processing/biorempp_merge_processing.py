@@ -26,6 +26,8 @@ import os
 
 import pandas as pd
 
+from biorempp.utils.dtype_utils import unify_categorical_key
+
 # Technical logging (silent to console, file only)
 logger = logging.getLogger("biorempp.input_processing.biorempp_merge_processing")
 
@@ -34,6 +36,7 @@ def merge_input_with_biorempp(
     input_data: pd.DataFrame,
     database_filepath: str = None,
     optimize_types: bool = True,
+    database_df: pd.DataFrame = None,
 ) -> pd.DataFrame:
     """
     Merge input data with BioRemPP reference database in CSV format.
@@ -54,6 +57,9 @@ def merge_input_with_biorempp(
     optimize_types : bool, optional
         If True, applies dtype optimization using optimize_dtypes_biorempp
         to reduce memory usage through categorical conversions. Default: True.
+    database_df : pd.DataFrame, optional
+        Preloaded database contents. If provided, the CSV file is not read
+        again (the path is still validated). Default: None.
 
     Returns
     -------
@@ -91,11 +97,11 @@ def merge_input_with_biorempp(
     """
     if database_filepath is None:
         database_filepath = os.path.join("data", "database_biorempp.csv")
-    logger.info(f"Using database file: {database_filepath}")
+    logger.info("Using database file: %s", database_filepath)
 
     # Check file existence
     if not os.path.exists(database_filepath):
-        logger.error(f"Database file not found: {database_filepath}")
+        logger.error("Database file not found: %s", database_filepath)
         raise FileNotFoundError(f"Database file not found: {database_filepath}")
 
     # Only .csv accepted
@@ -105,16 +111,23 @@ def merge_input_with_biorempp(
 
     # Load database
 
-    try:
-        database_df = pd.read_csv(database_filepath, encoding="utf-8", sep=";")
+    if database_df is None:
+        try:
+            database_df = pd.read_csv(database_filepath, encoding="utf-8", sep=";")
+            logger.info(
+                "Database loaded (%d rows, %d columns)",
+                database_df.shape[0],
+                database_df.shape[1],
+            )
+        except Exception:
+            logger.exception("Error loading database CSV.")
+            raise
+    else:
         logger.info(
-            "Database loaded (%d rows, %d columns)",
+            "Using preloaded Database (%d rows, %d columns)",
             database_df.shape[0],
             database_df.shape[1],
         )
-    except Exception:
-        logger.exception("Error loading database CSV.")
-        raise
 
     # Optimize types if requested
     if optimize_types:
@@ -125,18 +138,24 @@ def merge_input_with_biorempp(
     # Validate presence of 'ko' column
     for df_name, df in {"input_data": input_data, "database_df": database_df}.items():
         if "ko" not in df.columns:
-            logger.error(f"Missing 'ko' column in {df_name}.")
+            logger.error("Missing 'ko' column in %s.", df_name)
             raise KeyError(
                 "Column 'ko' must be present in both input and database DataFrames."
             )
 
+    # Shared categories let pandas join on category codes
+    input_data, database_df = unify_categorical_key(input_data, database_df, "ko")
+
     # Perform merge by 'ko' field
-    merged_df = pd.merge(input_data, database_df, on="ko", how="inner")
+    # 'ko' repeats in both the input and the database
+    merged_df = pd.merge(
+        input_data, database_df, on="ko", how="inner", validate="many_to_many"
+    )
 
     if optimize_types:
         merged_df = optimize_dtypes_biorempp(merged_df)
 
-    logger.info(f"Merge completed. Final shape: {merged_df.shape}")
+    logger.info("Merge completed. Final shape: %s", merged_df.shape)
     return merged_df
 
 
@@ -207,7 +226,7 @@ def optimize_dtypes_biorempp(df: pd.DataFrame) -> pd.DataFrame:
 
     for col in categorical_columns:
         if col in df.columns:
-            logger.debug(f"Converting column '{col}' to categorical.")
+            logger.debug("Converting column '%s' to categorical.", col)
             df[col] = df[col].astype("category")
     logger.info("Dtype optimization completed.")
     return df
@@ -35,6 +35,8 @@ import os
 
 import pandas as pd
 
+from biorempp.utils.dtype_utils import unify_categorical_key
+
 # Technical logging (silent to console, file only)
 logger = logging.getLogger("biorempp.input_processing.hadeg_merge_processing")
 
@@ -43,6 +45,7 @@ def merge_input_with_hadeg(
     input_data: pd.DataFrame,
     database_filepath: str = None,
     optimize_types: bool = True,
+    database_df: pd.DataFrame = None,
 ) -> pd.DataFrame:
     """
     Merge input data with HADEG database using 'ko' column.
@@ -63,6 +66,9 @@ def merge_input_with_hadeg(
     optimize_types : bool, optional
         Whether to optimize DataFrame types using categorical conversions
         for memory efficiency. Default: True.
+    database_df : pd.DataFrame, optional
+        Preloaded database contents. If provided, the CSV file is not read
+        again (the path is still validated). Default: None.
 
     Returns
     -------
@@ -110,11 +116,11 @@ def merge_input_with_hadeg(
     if database_filepath is None:
         this_dir = os.path.dirname(os.path.abspath(__file__))
         database_filepath = os.path.join(this_dir, "..", "data", "database_hadeg.csv")
-    logger.info(f"Using HADEG database file: {database_filepath}")
+    logger.info("Using HADEG database file: %s", database_filepath)
 
     # Check file existence
     if not os.path.exists(database_filepath):
-        logger.error(f"Database file not found: {database_filepath}")
+        logger.error("Database file not found: %s", database_filepath)
         raise FileNotFoundError(f"Database file not found: {database_filepath}")
 
     # Only CSV files are supported
@@ -124,16 +130,23 @@ def merge_input_with_hadeg(
 
     # Load database
 
-    try:
-        database_df = pd.read_csv(database_filepath, encoding="utf-8", sep=";")
+    if database_df is None:
+        try:
+            database_df = pd.read_csv(database_filepath, encoding="utf-8", sep=";")
+            logger.info(
+                "HADEG database loaded (%d rows, %d columns)",
+                database_df.shape[0],
+                database_df.shape[1],
+            )
+        except Exception:
+            logger.exception("Error loading HADEG database CSV.")
+            raise
+    else:
         logger.info(
-            "HADEG database loaded (%d rows, %d columns)",
+            "Using preloaded HADEG database (%d rows, %d columns)",
             database_df.shape[0],
             database_df.shape[1],
         )
-    except Exception:
-        logger.exception("Error loading HADEG database CSV.")
-        raise
 
     # Optimize types if requested
     if optimize_types:
@@ -144,18 +157,24 @@ def merge_input_with_hadeg(
     # Validate presence of 'ko' column
     for df_name, df in {"input_data": input_data, "database_df": database_df}.items():
         if "ko" not in df.columns:
-            logger.error(f"Missing 'ko' column in {df_name}.")
+            logger.error("Missing 'ko' column in %s.", df_name)
             raise KeyError(
                 "Column 'ko' must be present in both input and database DataFrames."
             )
 
+    # Shared categories let pandas join on category codes
+    input_data, database_df = unify_categorical_key(input_data, database_df, "ko")
+
     # Perform merge on 'ko' field
-    merged_df = pd.merge(input_data, database_df, on="ko", how="inner")
+    # 'ko' repeats in both the input and the database
+    merged_df = pd.merge(
+        input_data, database_df, on="ko", how="inner", validate="many_to_many"
+    )
 
     if optimize_types:
         merged_df = optimize_dtypes_hadeg(merged_df)
 
-    logger.info(f"Merge completed. Final shape: {merged_df.shape}")
+    logger.info("Merge completed. Final shape: %s", merged_df.shape)
     return merged_df
 
 
@@ -217,7 +236,7 @@ def optimize_dtypes_hadeg(df: pd.DataFrame) -> pd.DataFrame:
 
     for col in categorical_columns:
         if col in df.columns:
-            logger.debug(f"Converting column '{col}' to categorical.")
+            logger.debug("Converting column '%s' to categorical.", col)
             df[col] = df[col].astype("category")
 
     logger.info("HADEG DataFrame type optimization completed.")
@@ -24,6 +24,7 @@ Pipeline Flow:
 """
 
 import logging
+from concurrent.futures import Future
 
 from biorempp.input_processing.biorempp_merge_processing import (
     merge_input_with_biorempp,
@@ -35,11 +36,12 @@ logger = logging.getLogger("biorempp.input_processing.input_loader")
 
 
 def load_and_merge_input(
-    contents: str,
+    contents,
     filename: str,
     database_filepath: str = "src/biorempp/data/database_biorempp.csv",
     optimize_types: bool = True,
     merge_function=None,
+    database_df=None,
 ) -> tuple:
     """
     Complete pipeline: validates, processes, and merges input with database.
@@ -51,8 +53,9 @@ def load_and_merge_input(
 
     Parameters
     ----------
-    contents : str
-        Contents of the input file. Can be plain text or base64-encoded
+    contents : str or file-like
+        Contents of the input file, or a text file object opened for
+        reading (parsed line by line). Can be plain text or base64-encoded
         data URI format (data:text/plain;base64,<encoded_content>).
     filename : str
         Name of the input file, used for format validation and logging.
@@ -67,6 +70,11 @@ def load_and_merge_input(
         Custom merge function to use for database integration. If None,
         uses merge_input_with_biorempp as default. Function should accept
         (df_input, database_filepath, optimize_types) parameters.
+    database_df : pd.DataFrame or concurrent.futures.Future, optional
+        Preloaded database contents forwarded to the merge function so the
+        database CSV is not parsed again. A Future (e.g. a database being
+        loaded in a background thread) is resolved after the input has been
+        validated. Default: None.
 
     Returns
     -------
@@ -100,16 +108,24 @@ def load_and_merge_input(
     # 1. Validate and parse input
     df_input, error = validate_and_process_input(contents, filename)
     if error:
-        logger.error(f"Input validation/processing error: {error}")
+        logger.error("Input validation/processing error: %s", error)
         return None, f"Input processing error: {error}"
 
     # 2. Merge with reference database
 
+    if isinstance(database_df, Future):
+        database_df = database_df.result()
+
+    merge_kwargs = {}
+    if database_df is not None:
+        merge_kwargs["database_df"] = database_df
+
     try:
         df_merged = merge_function(
             df_input,
             database_filepath=database_filepath,
             optimize_types=optimize_types,
+            **merge_kwargs,
         )
         logger.info("Database merge completed successfully.")
         return df_merged, None
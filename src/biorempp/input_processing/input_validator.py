@@ -33,16 +33,38 @@ Supported Features:
 """
 
 import base64
+import itertools
 import logging
 import re
 
+import numpy as np
 import pandas as pd
 
 # Technical logging (silent to console, file only)
 logger = logging.getLogger("biorempp.input_processing.input_validator")
 
+try:
+    from numba import njit
 
-def validate_and_process_input(contents: str, filename: str):
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+# Compiled once; shared by every call to process_content_lines
+_IDENTIFIER_PATTERN = re.compile(r"^>([^\n]+)")
+_KO_PATTERN = re.compile(r"^(K\d+)$")
+
+# Number of lines parsed per batch when reading from a file object
+_LINE_BATCH_SIZE = 1 << 16
+
+# Line kinds reported by _classify_lines
+_LINE_BLANK = 0
+_LINE_SAMPLE = 1
+_LINE_KO = 2
+_LINE_INVALID = 3
+
+
+def validate_and_process_input(contents, filename: str):
     """
     Validate and process input files, returning DataFrame or error message.
 
@@ -53,9 +75,11 @@ def validate_and_process_input(contents: str, filename: str):
 
     Parameters
     ----------
-    contents : str
-        File content as string. Can be plain text or base64-encoded data URI
-        in format: data:text/plain;base64,<encoded_content>
+    contents : str or file-like
+        File content as string, or a text file object opened for reading.
+        Can be plain text or base64-encoded data URI in format:
+        data:text/plain;base64,<encoded_content>. File objects are parsed
+        line by line without loading the whole file into memory.
     filename : str
         Name of the input file. Used for extension validation and logging.
         Must have .txt extension.
@@ -84,7 +108,7 @@ def validate_and_process_input(contents: str, filename: str):
     - Base64 decoding is automatically handled
     - All validation errors include line numbers for debugging
     """
-    logger.info(f"Processing file: {filename}")
+    logger.info("Processing file: %s", filename)
 
     # 1. Validate extension
     if not filename.lower().endswith(".txt"):
@@ -93,6 +117,13 @@ def validate_and_process_input(contents: str, filename: str):
         return None, error
 
     # 2. Decode if necessary
+    if not isinstance(contents, str):
+        # Stream plain text files; only base64 data URIs need full content
+        first_line = contents.readline()
+        if first_line.startswith("data"):
+            contents = first_line + contents.read()
+        else:
+            contents = itertools.chain([first_line], contents)
 
     try:
         decoded_content = decode_content_if_base64(contents)
@@ -119,14 +150,15 @@ def decode_content_if_base64(contents: str) -> str:
 
     Parameters
     ----------
-    contents : str
+    contents : str or iterable of str
         Input content string. Can be plain text or base64 data URI in
-        format: data:text/plain;base64,<encoded_content>
+        format: data:text/plain;base64,<encoded_content>. Iterables of
+        lines are returned unchanged.
 
     Returns
     -------
-    str
-        Decoded content as UTF-8 string.
+    str or iterable of str
+        Decoded content as UTF-8 string, or the original lines.
 
     Raises
     ------
@@ -139,7 +171,7 @@ def decode_content_if_base64(contents: str) -> str:
     - Validates that decoded content is not empty
     - Preserves original content if not base64-encoded
     """
-    if contents.startswith("data"):
+    if isinstance(contents, str) and contents.startswith("data"):
         try:
             _, content_string = contents.split(",", 1)
             decoded_bytes = base64.b64decode(content_string)
@@ -154,7 +186,7 @@ def decode_content_if_base64(contents: str) -> str:
     return contents
 
 
-def process_content_lines(content: str):
+def process_content_lines(content):
     """
     Parse and validate content lines to extract sample-KO pairs.
 
@@ -165,8 +197,9 @@ def process_content_lines(content: str):
 
     Parameters
     ----------
-    content : str
-        Input content as plain text string with newline-separated entries.
+    content : str or iterable of str
+        Input content as plain text string with newline-separated entries,
+        or an iterable of lines (e.g. an open text file) consumed lazily.
 
     Returns
     -------
@@ -197,40 +230,221 @@ def process_content_lines(content: str):
     Notes
     -----
     - Regex patterns: '^>([^\\n]+)' for samples, '^(K\\d+)$' for KO entries
+    - Content is parsed in batches of lines; well-formed batches are
+      classified with array operations (a compiled byte scanner when numba
+      is installed, NumPy otherwise) and only invalid batches go through
+      the regex validator
     - Line numbers are 1-indexed in error messages
     - Sample IDs are stripped of leading/trailing whitespace
     - KO entries without preceding sample ID generate format errors
     """
-    lines = content.strip().split("\n")
-    identifier_pattern = re.compile(r"^>([^\n]+)")
-    ko_pattern = re.compile(r"^(K\d+)$")
+    if isinstance(content, str):
+        batches = [content.strip()]
+    else:
+        batches = _iter_line_batches(content)
 
-    data = []
+    samples = []
+    kos = []
     current_sample = None
+    line_offset = 0
+
+    for text in batches:
+        lines = text.split("\n")
+
+        parsed, current_sample = _parse_lines_fast(
+            text, lines, current_sample, samples, kos
+        )
+        if not parsed:
+            current_sample, error = _parse_lines_regex(
+                lines, line_offset, current_sample, samples, kos
+            )
+            if error:
+                return None, error
+
+        line_offset += len(lines)
+
+    if not kos:
+        return None, "No valid sample or KO entries found in the file."
+    df = pd.DataFrame({"sample": samples, "ko": kos})
+    return df, None
+
+
+def _iter_line_batches(lines):
+    """Yield newline-joined batches of up to _LINE_BATCH_SIZE lines."""
+    lines = iter(lines)
+    while True:
+        batch = list(itertools.islice(lines, _LINE_BATCH_SIZE))
+        if not batch:
+            return
+        yield "\n".join(map(str.rstrip, batch))
+
 
-    for line_num, line in enumerate(lines, start=1):
+def _parse_lines_regex(lines, line_offset, current_sample, samples, kos):
+    """
+    Parse lines with the reference regex validator.
+
+    Sample IDs and KO entries are appended to ``samples`` and ``kos``.
+
+    Returns
+    -------
+    tuple[str | None, str | None]
+        Current sample ID after the last line, and an error message with
+        the 1-indexed line number if a line is invalid.
+    """
+    for line_num, line in enumerate(lines, start=line_offset + 1):
         line = line.strip()
         if not line:
             continue
-        id_match = identifier_pattern.match(line)
-        ko_match = ko_pattern.match(line)
+        id_match = _IDENTIFIER_PATTERN.match(line)
+        ko_match = _KO_PATTERN.match(line)
         if id_match:
             current_sample = id_match.group(1).strip()
         elif ko_match and current_sample:
-            ko_value = ko_match.group(1).strip()
-            data.append({"sample": current_sample, "ko": ko_value})
+            samples.append(current_sample)
+            kos.append(ko_match.group(1))
         elif ko_match and not current_sample:
             # KO without sample before = format error
-            return None, (
+            return current_sample, (
                 f"Invalid format at line {line_num}: '{line}'. "
                 "Expected '>' for sample ID before KO entry."
             )
         elif not id_match and not ko_match:
-            return None, (
+            return current_sample, (
                 f"Invalid format at line {line_num}: '{line}'. "
                 "Expected '>' for sample ID or 'Kxxxxx' for KO entries."
             )
-    if not data:
-        return None, "No valid sample or KO entries found in the file."
-    df = pd.DataFrame(data)
-    return df, None
+    return current_sample, None
+
+
+def _classify_lines(buf, kinds):
+    """
+    Classify each newline-separated line of a UTF-8 buffer.
+
+    Lines are stripped of ASCII whitespace and classified as blank, sample
+    header ('>' followed by an ID), KO entry ('K' followed by ASCII digits)
+    or invalid. Compiled with numba when it is installed.
+
+    Parameters
+    ----------
+    buf : np.ndarray
+        uint8 view of the encoded text.
+    kinds : np.ndarray
+        uint8 output array with one slot per line.
+    """
+    n_bytes = buf.shape[0]
+    line = 0
+    start = 0
+    for pos in range(n_bytes + 1):
+        if pos < n_bytes and buf[pos] != 10:
+            continue
+
+        lo = start
+        hi = pos
+        while lo < hi and (buf[lo] == 32 or 9 <= buf[lo] <= 13):
+            lo += 1
+        while hi > lo and (buf[hi - 1] == 32 or 9 <= buf[hi - 1] <= 13):
+            hi -= 1
+
+        if lo == hi:
+            kind = _LINE_BLANK
+        elif buf[lo] == 62:  # '>'
+            kind = _LINE_SAMPLE if hi - lo > 1 else _LINE_INVALID
+        elif buf[lo] == 75 and hi - lo > 1:  # 'K'
+            kind = _LINE_KO
+            for i in range(lo + 1, hi):
+                if buf[i] < 48 or buf[i] > 57:
+                    kind = _LINE_INVALID
+                    break
+        else:
+            kind = _LINE_INVALID
+
+        kinds[line] = kind
+        line += 1
+        start = pos + 1
+
+
+if _NUMBA_AVAILABLE:
+    _classify_lines = njit(cache=True, boundscheck=False)(_classify_lines)
+
+
+def _classify_lines_vectorized(lines):
+    """
+    Classify lines with NumPy array operations.
+
+    Produces the same kinds as _classify_lines for ASCII input, without
+    numba: the lines are joined into one UTF-8 buffer and each line is
+    classified from its length, first byte and number of non-digit bytes.
+
+    Parameters
+    ----------
+    lines : list of str
+        Stripped lines of one batch.
+
+    Returns
+    -------
+    np.ndarray
+        uint8 array with one line kind per line.
+    """
+    buf = np.frombuffer("\n".join(lines).encode("utf-8"), dtype=np.uint8)
+    newlines = np.flatnonzero(buf == 10)
+    starts = np.concatenate(([0], newlines + 1))
+    ends = np.concatenate((newlines, [buf.size]))
+    lengths = ends - starts
+
+    non_blank = lengths > 0
+    first = np.zeros(len(starts), dtype=np.uint8)
+    first[non_blank] = buf[starts[non_blank]]
+
+    # Non-digit bytes after the first byte of each line, from a prefix sum
+    non_digits = np.concatenate(([0], np.cumsum((buf < 48) | (buf > 57))))
+    tail_non_digits = non_digits[ends] - non_digits[np.minimum(starts + 1, ends)]
+
+    kinds = np.full(len(starts), _LINE_INVALID, dtype=np.uint8)
+    kinds[~non_blank] = _LINE_BLANK
+    kinds[(first == 62) & (lengths > 1)] = _LINE_SAMPLE  # '>'
+    kinds[(first == 75) & (lengths > 1) & (tail_non_digits == 0)] = _LINE_KO  # 'K'
+    return kinds
+
+
+def _parse_lines_fast(text, lines, current_sample, samples, kos):
+    """
+    Parse a batch of lines with the array-based line classifier.
+
+    Only handles well-formed batches: if any line is invalid, or would be
+    parsed differently by the regex validator (e.g. non-ASCII whitespace),
+    nothing is appended and the caller falls back to _parse_lines_regex,
+    which produces the exact error message.
+
+    Returns
+    -------
+    tuple[bool, str | None]
+        Whether the batch was parsed, and the current sample ID after it.
+    """
+    if _NUMBA_AVAILABLE:
+        kinds = np.empty(len(lines), dtype=np.uint8)
+        _classify_lines(np.frombuffer(text.encode("utf-8"), dtype=np.uint8), kinds)
+    else:
+        lines = [line.strip() for line in lines]
+        kinds = _classify_lines_vectorized(lines)
+    if (kinds == _LINE_INVALID).any():
+        return False, current_sample
+
+    is_sample = kinds == _LINE_SAMPLE
+    sample_names = [lines[i].strip()[1:].strip() for i in np.flatnonzero(is_sample)]
+    if not all(sample_names):
+        return False, current_sample
+
+    # Rank of the last sample header at or before each KO line; -1 selects
+    # the sample carried over from the previous batch
+    ko_lines = np.flatnonzero(kinds == _LINE_KO)
+    ko_owners = (np.cumsum(is_sample) - 1)[ko_lines]
+    if current_sample is None and len(ko_owners) and ko_owners[0] < 0:
+        return False, current_sample
+
+    names = np.array(sample_names + [current_sample], dtype=object)
+    samples.extend(names[ko_owners].tolist())
+    kos.extend([lines[i].strip() for i in ko_lines])
+
+    if sample_names:
+        current_sample = sample_names[-1]
+    return True, current_sample
@@ -29,6 +29,8 @@ import os
 
 import pandas as pd
 
+from biorempp.utils.dtype_utils import unify_categorical_key
+
 # Technical logging (silent to console, file only)
 logger = logging.getLogger("biorempp.input_processing.kegg_merge_processing")
 
@@ -37,6 +39,7 @@ def merge_input_with_kegg(
     input_data: pd.DataFrame,
     kegg_filepath: str = None,
     optimize_types: bool = True,
+    database_df: pd.DataFrame = None,
 ) -> pd.DataFrame:
     """
     Merge input data with KEGG degradation pathway information from CSV file.
@@ -57,6 +60,9 @@ def merge_input_with_kegg(
     optimize_types : bool, optional
         If True, optimizes DataFrame dtypes using categorical columns for
         memory efficiency. Default: True.
+    database_df : pd.DataFrame, optional
+        Preloaded database contents. If provided, the CSV file is not read
+        again (the path is still validated). Default: None.
 
     Returns
     -------
@@ -98,11 +104,11 @@ def merge_input_with_kegg(
     """
     if kegg_filepath is None:
         kegg_filepath = os.path.join("data", "kegg_degradation_pathways.csv")
-    logger.info(f"Using KEGG file: {kegg_filepath}")
+    logger.info("Using KEGG file: %s", kegg_filepath)
 
     # Check file existence
     if not os.path.exists(kegg_filepath):
-        logger.error(f"KEGG file not found: {kegg_filepath}")
+        logger.error("KEGG file not found: %s", kegg_filepath)
         raise FileNotFoundError(f"KEGG file not found: {kegg_filepath}")
 
     # Only .csv files are supported
@@ -112,16 +118,24 @@ def merge_input_with_kegg(
 
     # Load KEGG database
 
-    try:
-        kegg_df = pd.read_csv(kegg_filepath, encoding="utf-8", sep=";")
+    if database_df is None:
+        try:
+            kegg_df = pd.read_csv(kegg_filepath, encoding="utf-8", sep=";")
+            logger.info(
+                "KEGG database loaded (%d rows, %d columns)",
+                kegg_df.shape[0],
+                kegg_df.shape[1],
+            )
+        except Exception:
+            logger.exception("Error loading KEGG CSV.")
+            raise
+    else:
+        kegg_df = database_df
         logger.info(
-            "KEGG database loaded (%d rows, %d columns)",
+            "Using preloaded KEGG database (%d rows, %d columns)",
             kegg_df.shape[0],
             kegg_df.shape[1],
         )
-    except Exception:
-        logger.exception("Error loading KEGG CSV.")
-        raise
 
     # Optimize types if requested
     if optimize_types:
@@ -132,18 +146,24 @@ def merge_input_with_kegg(
     # Validate presence of 'ko' column
     for df_name, df in {"input_data": input_data, "kegg_df": kegg_df}.items():
         if "ko" not in df.columns:
-            logger.error(f"Missing 'ko' column in {df_name}.")
+            logger.error("Missing 'ko' column in %s.", df_name)
             raise KeyError(
                 "Column 'ko' must be present in both input and KEGG DataFrames."
             )
 
+    # Shared categories let pandas join on category codes
+    input_data, kegg_df = unify_categorical_key(input_data, kegg_df, "ko")
+
     # Perform merge on 'ko' field
-    merged_df = pd.merge(input_data, kegg_df, on="ko", how="inner")
+    # 'ko' repeats in both the input and the database
+    merged_df = pd.merge(
+        input_data, kegg_df, on="ko", how="inner", validate="many_to_many"
+    )
 
     if optimize_types:
         merged_df = optimize_dtypes_kegg(merged_df)
 
-    logger.info(f"Merge completed. Final shape: {merged_df.shape}")
+    logger.info("Merge completed. Final shape: %s", merged_df.shape)
     return merged_df
 
 
@@ -202,7 +222,7 @@ def optimize_dtypes_kegg(df: pd.DataFrame) -> pd.DataFrame:
 
     for col in categorical_columns:
         if col in df.columns:
-            logger.debug(f"Converting column '{col}' to categorical.")
+            logger.debug("Converting column '%s' to categorical.", col)
             df[col] = df[col].astype("category")
     logger.info("KEGG dtypes optimization completed.")
     return df
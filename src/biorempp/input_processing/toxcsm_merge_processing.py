@@ -34,12 +34,17 @@ import os
 
 import pandas as pd
 
+from biorempp.utils.dtype_utils import unify_categorical_key
+
 # Technical logging (silent to console, file only)
 logger = logging.getLogger("biorempp.input_processing.toxcsm_merge_processing")
 
 
 def merge_input_with_toxcsm(
-    input_data: pd.DataFrame, database_filepath: str = None, optimize_types: bool = True
+    input_data: pd.DataFrame,
+    database_filepath: str = None,
+    optimize_types: bool = True,
+    database_df: pd.DataFrame = None,
 ) -> pd.DataFrame:
     """
     Merge input data with ToxCSM database based on 'cpd' column.
@@ -58,6 +63,9 @@ def merge_input_with_toxcsm(
         Default: 'data/database_toxcsm.csv'
     optimize_types : bool, optional
         Whether to optimize DataFrame dtypes. Default: True
+    database_df : pd.DataFrame, optional
+        Preloaded database contents. If provided, the CSV file is not read
+        again (the path is still validated). Default: None.
 
     Returns
     -------
@@ -82,11 +90,11 @@ def merge_input_with_toxcsm(
     """
     if database_filepath is None:
         database_filepath = os.path.join("data", "database_toxcsm.csv")
-    logger.info(f"Using ToxCSM database file: {database_filepath}")
+    logger.info("Using ToxCSM database file: %s", database_filepath)
 
     # Check file existence
     if not os.path.exists(database_filepath):
-        logger.error(f"ToxCSM database file not found: {database_filepath}")
+        logger.error("ToxCSM database file not found: %s", database_filepath)
         raise FileNotFoundError(f"ToxCSM database file not found: {database_filepath}")
 
     # Only .csv format accepted
@@ -96,16 +104,23 @@ def merge_input_with_toxcsm(
 
     # Load ToxCSM database
 
-    try:
-        database_df = pd.read_csv(database_filepath, encoding="utf-8", sep=";")
+    if database_df is None:
+        try:
+            database_df = pd.read_csv(database_filepath, encoding="utf-8", sep=";")
+            logger.info(
+                "ToxCSM database loaded (%d rows, %d columns)",
+                database_df.shape[0],
+                database_df.shape[1],
+            )
+        except Exception:
+            logger.exception("Error loading ToxCSM database CSV.")
+            raise
+    else:
         logger.info(
-            "ToxCSM database loaded (%d rows, %d columns)",
+            "Using preloaded ToxCSM database (%d rows, %d columns)",
             database_df.shape[0],
             database_df.shape[1],
         )
-    except Exception:
-        logger.exception("Error loading ToxCSM database CSV.")
-        raise
 
     # Optimize types if requested
     if optimize_types:
@@ -116,7 +131,7 @@ def merge_input_with_toxcsm(
     # Validate presence of 'cpd' column
     for df_name, df in {"input_data": input_data, "database_df": database_df}.items():
         if "cpd" not in df.columns:
-            logger.error(f"Missing 'cpd' column in {df_name}.")
+            logger.error("Missing 'cpd' column in %s.", df_name)
             raise KeyError(
                 "Column 'cpd' must be present in both input and ToxCSM DataFrames."
             )
@@ -128,7 +143,7 @@ def merge_input_with_toxcsm(
     overlap_cols = input_cols.intersection(db_cols) - {"cpd"}
 
     if overlap_cols:
-        logger.info(f"Found overlapping columns: {overlap_cols}")
+        logger.info("Found overlapping columns: %s", overlap_cols)
         # For overlapping columns, prioritize input data and drop from database
         # except for ToxCSM-specific columns which should be kept
         toxcsm_specific_cols = {"SMILES", "ChEBI"} | {
@@ -137,16 +152,22 @@ def merge_input_with_toxcsm(
 
         cols_to_drop = overlap_cols - toxcsm_specific_cols
         if cols_to_drop:
-            logger.info(f"Dropping overlapping columns from database: {cols_to_drop}")
+            logger.info("Dropping overlapping columns from database: %s", cols_to_drop)
             database_df = database_df.drop(columns=list(cols_to_drop))
 
+    # Shared categories let pandas join on category codes
+    input_data, database_df = unify_categorical_key(input_data, database_df, "cpd")
+
     # Perform merge on 'cpd' column
-    merged_df = pd.merge(input_data, database_df, on="cpd", how="inner")
+    # 'cpd' repeats in both the input and the database
+    merged_df = pd.merge(
+        input_data, database_df, on="cpd", how="inner", validate="many_to_many"
+    )
 
     if optimize_types:
         merged_df = optimize_dtypes_toxcsm(merged_df)
 
-    logger.info(f"ToxCSM merge completed. Final shape: {merged_df.shape}")
+    logger.info("ToxCSM merge completed. Final shape: %s", merged_df.shape)
     return merged_df
 
 
@@ -193,23 +214,23 @@ def optimize_dtypes_toxcsm(df: pd.DataFrame) -> pd.DataFrame:
 
     for col in categorical_columns:
         if col in df.columns:
-            logger.debug(f"Converting column '{col}' to categorical.")
+            logger.debug("Converting column '%s' to categorical.", col)
             df[col] = df[col].astype("category")
 
     # Handle label_* columns (toxicity labels)
     label_columns = [col for col in df.columns if col.startswith("label_")]
     for col in label_columns:
-        logger.debug(f"Converting label column '{col}' to categorical.")
+        logger.debug("Converting label column '%s' to categorical.", col)
         df[col] = df[col].astype("category")
 
     # Handle value_* columns (numeric toxicity values)
     value_columns = [col for col in df.columns if col.startswith("value_")]
     for col in value_columns:
         try:
-            logger.debug(f"Converting value column '{col}' to float32.")
+            logger.debug("Converting value column '%s' to float32.", col)
             df[col] = pd.to_numeric(df[col], errors="coerce").astype("float32")
         except Exception as e:
-            logger.warning(f"Failed to convert column '{col}' to float32: {e}")
+            logger.warning("Failed to convert column '%s' to float32: %s", col, e)
 
     logger.info("ToxCSM DataFrame dtype optimization completed.")
     return df
@@ -16,6 +16,8 @@ Pipeline Functions:
     - run_kegg_processing_pipeline: KEGG degradation pathways analysis
     - run_hadeg_processing_pipeline: Hydrocarbon degradation analysis
     - run_toxcsm_processing_pipeline: Toxicity prediction analysis
+    - run_all_processing_pipelines: All of the above, run concurrently
+    - raise_pipeline_failures: Raise failed pipelines as one exception group
 
 Pipeline Architecture:
     Each pipeline follows a consistent structure:
@@ -40,6 +42,9 @@ Usage Examples:
 """
 
 from .input_processing import (
+    PipelineContext,
+    raise_pipeline_failures,
+    run_all_processing_pipelines,
     run_biorempp_processing_pipeline,
     run_hadeg_processing_pipeline,
     run_kegg_processing_pipeline,
@@ -51,4 +56,7 @@ __all__ = [
     "run_kegg_processing_pipeline",
     "run_hadeg_processing_pipeline",
     "run_toxcsm_processing_pipeline",
+    "run_all_processing_pipelines",
+    "PipelineContext",
+    "raise_pipeline_failures",
 ]
@@ -48,17 +48,269 @@ Error Handling:
     - Comprehensive logging throughout the pipeline
 """
 
+import functools
+import importlib.util
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional
+
+import pandas as pd
 
 from biorempp.input_processing.hadeg_merge_processing import merge_input_with_hadeg
 from biorempp.input_processing.input_loader import load_and_merge_input
+from biorempp.input_processing.input_validator import validate_and_process_input
 from biorempp.input_processing.kegg_merge_processing import merge_input_with_kegg
 from biorempp.input_processing.toxcsm_merge_processing import merge_input_with_toxcsm
-from biorempp.utils.io_utils import save_dataframe_output
+from biorempp.utils.io_utils import (
+    check_output_dependencies,
+    compute_file_digest,
+    compute_output_cache_key,
+    get_output_filename,
+    restore_cached_output,
+    save_dataframe_output,
+    store_cached_output,
+)
 from biorempp.utils.logging_config import get_logger
 
 logger = get_logger("pipelines.input_processing")
 
+# Default database locations, resolved once at import time
+_PKG_DATA_DIR = os.path.normpath(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+)
+_DEFAULT_DB_PATHS = {
+    "biorempp": os.path.join(_PKG_DATA_DIR, "database_biorempp.csv"),
+    "kegg": os.path.join(_PKG_DATA_DIR, "kegg_degradation_pathways.csv"),
+    "hadeg": os.path.join(_PKG_DATA_DIR, "database_hadeg.csv"),
+    "toxcsm": os.path.join(_PKG_DATA_DIR, "database_toxcsm.csv"),
+}
+
+# The multi-threaded pyarrow CSV engine is used for databases when installed
+_PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+@dataclass
+class PipelineContext:
+    """
+    Intermediate results shared between pipelines run on the same input.
+
+    Passing the same context to :func:`run_biorempp_processing_pipeline`
+    and :func:`run_toxcsm_processing_pipeline` lets the ToxCSM pipeline reuse
+    the BioRemPP merge instead of computing it a second time. The ToxCSM
+    pipeline releases the merge from the context once it has used it.
+
+    Attributes
+    ----------
+    input_path : str
+        Input file the context belongs to.
+    df_biorempp : pd.DataFrame, optional
+        Input merged with the BioRemPP database.
+    biorempp_database_path : str, optional
+        Database file used to build ``df_biorempp``.
+    optimize_types : bool, optional
+        ``optimize_types`` value used to build ``df_biorempp``.
+    """
+
+    input_path: str
+    df_biorempp: Optional[pd.DataFrame] = None
+    biorempp_database_path: Optional[str] = None
+    optimize_types: Optional[bool] = None
+
+
+def _stat_input_file(input_path):
+    """
+    Check that the input file exists with a single ``os.stat`` call.
+
+    Returns
+    -------
+    os.stat_result
+        Status of the input file.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the input file does not exist.
+    """
+    try:
+        return os.stat(input_path)
+    except FileNotFoundError:
+        error_msg = f"Input file not found: {input_path}"
+        logger.error(error_msg)
+        raise FileNotFoundError(error_msg) from None
+
+
+def _merge_with_biorempp(input_path, database_path, optimize_types, context=None):
+    """
+    Load the input and merge it with the BioRemPP database.
+
+    The result is taken from (and stored in) ``context`` when one is given
+    and it was built from the same input, database and options.
+
+    Returns
+    -------
+    tuple[pd.DataFrame | None, str | None]
+        Merged DataFrame and error message, as from load_and_merge_input.
+    """
+    if context is not None:
+        if os.path.abspath(context.input_path) != os.path.abspath(input_path):
+            raise ValueError(
+                f"Pipeline context belongs to {context.input_path}, "
+                f"not {input_path}"
+            )
+        if (
+            context.df_biorempp is not None
+            and os.path.abspath(context.biorempp_database_path)
+            == os.path.abspath(database_path)
+            and context.optimize_types == optimize_types
+        ):
+            logger.info("Reusing BioRemPP merge from pipeline context")
+            return context.df_biorempp, None
+
+    database_future = _prefetch_database(database_path)
+
+    logger.info("Reading input file: %s", input_path)
+    with open(input_path, "r", encoding="utf-8") as input_file:
+        df, error = load_and_merge_input(
+            input_file,
+            os.path.basename(input_path),
+            database_filepath=database_path,
+            optimize_types=optimize_types,
+            database_df=database_future,
+        )
+
+    if context is not None and error is None:
+        context.df_biorempp = df
+        context.biorempp_database_path = database_path
+        context.optimize_types = optimize_types
+
+    return df, error
+
+
+@functools.lru_cache(maxsize=8)
+def _load_database_cached(database_path, mtime_ns, size):
+    """
+    Parse a database CSV once per ``(path, mtime, size)``.
+
+    The modification time and size are part of the cache key so that an
+    edited database file is parsed again on the next pipeline run. The
+    pyarrow CSV engine is used when available, falling back to the default
+    pandas parser if it is missing or cannot read the file.
+    """
+    logger.debug("Loading database into cache: %s", database_path)
+    if _PYARROW_AVAILABLE:
+        try:
+            return pd.read_csv(
+                database_path, encoding="utf-8", sep=";", engine="pyarrow"
+            )
+        except Exception as e:
+            logger.debug("pyarrow CSV engine failed for %s: %s", database_path, e)
+    return pd.read_csv(database_path, encoding="utf-8", sep=";")
+
+
+def _get_cached_database(database_path):
+    """
+    Return a preloaded database DataFrame, reusing previously parsed files.
+
+    Parameters
+    ----------
+    database_path : str
+        Path to the database CSV file.
+
+    Returns
+    -------
+    pd.DataFrame or None
+        Shallow copy of the cached DataFrame (merge helpers convert columns
+        in place), or None if the file cannot be preloaded. In that case the
+        merge helpers load and validate the file themselves.
+    """
+    if not database_path or not database_path.lower().endswith(".csv"):
+        return None
+
+    try:
+        stat = os.stat(database_path)
+        database_df = _load_database_cached(
+            os.path.abspath(database_path), stat.st_mtime_ns, stat.st_size
+        )
+    except Exception as e:
+        logger.debug("Database preload skipped for %s: %s", database_path, e)
+        return None
+
+    return database_df.copy(deep=False)
+
+
+def _prefetch_database(database_path):
+    """
+    Start preloading a database in a background thread.
+
+    The CSV reader releases the GIL while parsing, so the database can be
+    loaded while the input file is read and validated in the calling thread.
+
+    Parameters
+    ----------
+    database_path : str
+        Path to the database CSV file.
+
+    Returns
+    -------
+    concurrent.futures.Future
+        Future resolving to the result of ``_get_cached_database``.
+    """
+    # A short-lived executor per call keeps this safe in forked workers
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="biorempp-db")
+    try:
+        return executor.submit(_get_cached_database, database_path)
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _check_output_cache(
+    input_path, database_paths, output_dir, output_filename, add_timestamp, options
+):
+    """
+    Look up a cached output for a pipeline run.
+
+    Parameters
+    ----------
+    input_path : str
+        Path to the input file; its content is hashed.
+    database_paths : list of str
+        Database files the pipeline output depends on.
+    output_dir : str
+        Directory where the output file is written.
+    output_filename : str
+        Name of the output file.
+    add_timestamp : bool
+        Whether to add timestamp to output filename.
+    options : tuple
+        Pipeline name and options that affect the output.
+
+    Returns
+    -------
+    tuple
+        ``(cache_key, result)``. ``cache_key`` is None if the run cannot be
+        cached; ``result`` is the pipeline result dict on a cache hit, or None.
+    """
+    input_digest = compute_file_digest(input_path)
+    cache_key = compute_output_cache_key(input_digest, database_paths, *options)
+    if cache_key is None:
+        return None, None
+
+    cached = restore_cached_output(
+        cache_key, output_dir, output_filename, add_timestamp
+    )
+    if cached is None:
+        logger.debug("Output cache miss: %s", cache_key)
+        return cache_key, None
+
+    output_path, matches = cached
+    return cache_key, {
+        "output_path": output_path,
+        "matches": matches,
+        "filename": os.path.basename(output_path),
+    }
+
 
 def run_biorempp_processing_pipeline(
     input_path,
@@ -68,6 +320,10 @@ def run_biorempp_processing_pipeline(
     sep=";",
     optimize_types=True,
     add_timestamp=False,
+    output_format="txt",
+    use_cache=False,
+    context=None,
+    save=True,
 ):
     """
     Run complete BioRemPP database processing pipeline.
@@ -96,6 +352,24 @@ def run_biorempp_processing_pipeline(
         for memory efficiency. Default: True.
     add_timestamp : bool, optional
         Whether to add timestamp to output filename. Default: False.
+    output_format : str, optional
+        Output file format: 'txt' (delimited text), 'parquet' or 'feather'.
+        For binary formats the output filename extension is replaced and
+        pyarrow is required. Default: 'txt'.
+    use_cache : bool, optional
+        Whether to reuse the output of a previous run with identical input
+        content, database files, options and BioRemPP version. Cached
+        outputs are kept under '<output_dir>/.cache', which holds the most
+        recently used entries and can be deleted to clear the cache.
+        Default: False.
+    context : PipelineContext, optional
+        Shared intermediate results for pipelines run on the same input.
+        The BioRemPP merge is reused from it if present, and stored in it
+        otherwise. Default: None.
+    save : bool, optional
+        Whether to write the merged DataFrame to disk. If False, nothing is
+        written, the output cache is not used, and 'output_path' and
+        'filename' are None in the result. Default: True.
 
     Returns
     -------
@@ -134,34 +408,39 @@ def run_biorempp_processing_pipeline(
     - Output includes all columns from both input and database
     - Processing time and memory usage scale with input size
     """
-    logger.info(f"Starting input processing pipeline for: {input_path}")
+    logger.info("Starting input processing pipeline for: %s", input_path)
     logger.debug(
-        f"Pipeline parameters - database: {database_path}, "
-        f"output_dir: {output_dir}, optimize_types: {optimize_types}"
+        "Pipeline parameters - database: %s, output_dir: %s, optimize_types: %s",
+        database_path,
+        output_dir,
+        optimize_types,
     )
 
-    if not os.path.exists(input_path):
-        error_msg = f"Input file not found: {input_path}"
-        logger.error(error_msg)
-        raise FileNotFoundError(error_msg)
+    _stat_input_file(input_path)
+
+    output_filename = get_output_filename(output_filename, output_format)
+    check_output_dependencies(output_format)
 
     if database_path is None:
-        this_dir = os.path.dirname(os.path.abspath(__file__))
-        database_path = os.path.normpath(
-            os.path.join(this_dir, "..", "data", "database_biorempp.csv")
+        database_path = _DEFAULT_DB_PATHS["biorempp"]
+        logger.debug("Using default database path: %s", database_path)
+
+    cache_key = None
+    if use_cache and save:
+        cache_key, cached_result = _check_output_cache(
+            input_path,
+            [database_path],
+            output_dir,
+            output_filename,
+            add_timestamp,
+            ("biorempp", sep, optimize_types, output_format),
         )
-        logger.debug(f"Using default database path: {database_path}")
-
-    logger.info(f"Reading input file: {input_path}")
-    with open(input_path, "r", encoding="utf-8") as f:
-        input_content = f.read()
+        if cached_result is not None:
+            return cached_result
 
     logger.info("Loading and merging input data")
-    df, error = load_and_merge_input(
-        input_content,
-        os.path.basename(input_path),
-        database_filepath=database_path,
-        optimize_types=optimize_types,
+    df, error = _merge_with_biorempp(
+        input_path, database_path, optimize_types, context=context
     )
 
     if error:
@@ -169,21 +448,34 @@ def run_biorempp_processing_pipeline(
         logger.error(error_msg)
         raise RuntimeError(error_msg)
 
-    logger.info(f"Saving merged DataFrame to: {output_dir}/{output_filename}")
+    if not save:
+        logger.info("Output saving skipped; returning the match count only")
+        return {
+            "output_path": None,
+            "matches": df.shape[0],
+            "filename": None,
+        }
+
+    logger.info("Saving merged DataFrame to: %s/%s", output_dir, output_filename)
     output_path = save_dataframe_output(
         df,
         output_dir=output_dir,
         filename=output_filename,
         sep=sep,
         add_timestamp=add_timestamp,
+        output_format=output_format,
     )
 
-    logger.info(f"Pipeline completed successfully. Output saved to: {output_path}")
+    logger.info("Pipeline completed successfully. Output saved to: %s", output_path)
+
+    matches = df.shape[0]
+    if cache_key is not None:
+        store_cached_output(cache_key, output_dir, output_path, matches)
 
     # Return structured data for user feedback
     return {
         "output_path": output_path,
-        "matches": len(df) if df is not None else 0,
+        "matches": matches,
         "filename": os.path.basename(output_path),
     }
 
@@ -196,6 +488,9 @@ def run_kegg_processing_pipeline(
     sep=";",
     optimize_types=True,
     add_timestamp=False,
+    output_format="txt",
+    use_cache=False,
+    save=True,
 ):
     """
     Run complete KEGG degradation pathway processing pipeline.
@@ -225,6 +520,20 @@ def run_kegg_processing_pipeline(
         for memory efficiency. Default: True.
     add_timestamp : bool, optional
         Whether to add timestamp to output filename. Default: False.
+    output_format : str, optional
+        Output file format: 'txt' (delimited text), 'parquet' or 'feather'.
+        For binary formats the output filename extension is replaced and
+        pyarrow is required. Default: 'txt'.
+    use_cache : bool, optional
+        Whether to reuse the output of a previous run with identical input
+        content, database files, options and BioRemPP version. Cached
+        outputs are kept under '<output_dir>/.cache', which holds the most
+        recently used entries and can be deleted to clear the cache.
+        Default: False.
+    save : bool, optional
+        Whether to write the merged DataFrame to disk. If False, nothing is
+        written, the output cache is not used, and 'output_path' and
+        'filename' are None in the result. Default: True.
 
     Returns
     -------
@@ -263,34 +572,43 @@ def run_kegg_processing_pipeline(
     - Gene symbols are available in 'genesymbol' column
     - Optimized for degradation pathway analysis
     """
-    from biorempp.input_processing.input_validator import validate_and_process_input
-
-    logger.info(f"Starting KEGG processing pipeline for: {input_path}")
+    logger.info("Starting KEGG processing pipeline for: %s", input_path)
     logger.debug(
-        f"Pipeline parameters - kegg_database: {kegg_database_path}, "
-        f"output_dir: {output_dir}, optimize_types: {optimize_types}"
+        "Pipeline parameters - kegg_database: %s, output_dir: %s, optimize_types: %s",
+        kegg_database_path,
+        output_dir,
+        optimize_types,
     )
 
-    if not os.path.exists(input_path):
-        error_msg = f"Input file not found: {input_path}"
-        logger.error(error_msg)
-        raise FileNotFoundError(error_msg)
+    _stat_input_file(input_path)
+
+    output_filename = get_output_filename(output_filename, output_format)
+    check_output_dependencies(output_format)
 
     if kegg_database_path is None:
-        this_dir = os.path.dirname(os.path.abspath(__file__))
-        kegg_database_path = os.path.normpath(
-            os.path.join(this_dir, "..", "data", "kegg_degradation_pathways.csv")
+        kegg_database_path = _DEFAULT_DB_PATHS["kegg"]
+        logger.debug("Using default KEGG database path: %s", kegg_database_path)
+
+    cache_key = None
+    if use_cache and save:
+        cache_key, cached_result = _check_output_cache(
+            input_path,
+            [kegg_database_path],
+            output_dir,
+            output_filename,
+            add_timestamp,
+            ("kegg", sep, optimize_types, output_format),
         )
-        logger.debug(f"Using default KEGG database path: {kegg_database_path}")
-        logger.debug(f"Using default KEGG database path: {kegg_database_path}")
+        if cached_result is not None:
+            return cached_result
 
-    logger.info(f"Reading input file: {input_path}")
-    with open(input_path, "r", encoding="utf-8") as f:
-        input_content = f.read()
+    kegg_future = _prefetch_database(kegg_database_path)
 
     # Validate and process input
+    logger.info("Reading input file: %s", input_path)
     logger.info("Validating and processing input data")
-    df, error = validate_and_process_input(input_content, os.path.basename(input_path))
+    with open(input_path, "r", encoding="utf-8") as input_file:
+        df, error = validate_and_process_input(input_file, os.path.basename(input_path))
 
     if error:
         error_msg = f"KEGG pipeline validation error: {error}"
@@ -300,24 +618,42 @@ def run_kegg_processing_pipeline(
     # Merge with KEGG database
     logger.info("Merging with KEGG degradation pathways")
     kegg_merged_df = merge_input_with_kegg(
-        df, kegg_filepath=kegg_database_path, optimize_types=optimize_types
+        df,
+        kegg_filepath=kegg_database_path,
+        optimize_types=optimize_types,
+        database_df=kegg_future.result(),
     )
 
-    logger.info(f"Saving KEGG merged DataFrame to: {output_dir}/{output_filename}")
+    if not save:
+        logger.info("Output saving skipped; returning the match count only")
+        return {
+            "output_path": None,
+            "matches": kegg_merged_df.shape[0],
+            "filename": None,
+        }
+
+    logger.info("Saving KEGG merged DataFrame to: %s/%s", output_dir, output_filename)
     output_path = save_dataframe_output(
         kegg_merged_df,
         output_dir=output_dir,
         filename=output_filename,
         sep=sep,
         add_timestamp=add_timestamp,
+        output_format=output_format,
+    )
+
+    logger.info(
+        "KEGG pipeline completed successfully. Output saved to: %s", output_path
     )
 
-    logger.info(f"KEGG pipeline completed successfully. Output saved to: {output_path}")
+    matches = kegg_merged_df.shape[0]
+    if cache_key is not None:
+        store_cached_output(cache_key, output_dir, output_path, matches)
 
     # Return structured data for user feedback
     return {
         "output_path": output_path,
-        "matches": len(kegg_merged_df) if kegg_merged_df is not None else 0,
+        "matches": matches,
         "filename": os.path.basename(output_path),
     }
 
@@ -330,6 +666,9 @@ def run_hadeg_processing_pipeline(
     sep=";",
     optimize_types=True,
     add_timestamp=False,
+    output_format="txt",
+    use_cache=False,
+    save=True,
 ):
     """
     Run complete HADEG hydrocarbon degradation processing pipeline.
@@ -358,6 +697,20 @@ def run_hadeg_processing_pipeline(
         for memory efficiency. Default: True.
     add_timestamp : bool, optional
         Whether to add timestamp to output filename. Default: False.
+    output_format : str, optional
+        Output file format: 'txt' (delimited text), 'parquet' or 'feather'.
+        For binary formats the output filename extension is replaced and
+        pyarrow is required. Default: 'txt'.
+    use_cache : bool, optional
+        Whether to reuse the output of a previous run with identical input
+        content, database files, options and BioRemPP version. Cached
+        outputs are kept under '<output_dir>/.cache', which holds the most
+        recently used entries and can be deleted to clear the cache.
+        Default: False.
+    save : bool, optional
+        Whether to write the merged DataFrame to disk. If False, nothing is
+        written, the output cache is not used, and 'output_path' and
+        'filename' are None in the result. Default: True.
 
     Returns
     -------
@@ -397,59 +750,85 @@ def run_hadeg_processing_pipeline(
     - Specialized for hydrocarbon contamination analysis
     - Ideal for petroleum spill and industrial contamination studies
     """
-    logger.info(f"Starting HADEG processing pipeline for: {input_path}")
+    logger.info("Starting HADEG processing pipeline for: %s", input_path)
     logger.debug(
-        f"Pipeline parameters - database: {hadeg_database_path}, "
-        f"output_dir: {output_dir}, optimize_types: {optimize_types}"
+        "Pipeline parameters - database: %s, output_dir: %s, optimize_types: %s",
+        hadeg_database_path,
+        output_dir,
+        optimize_types,
     )
 
-    if not os.path.exists(input_path):
-        error_msg = f"Input file not found: {input_path}"
-        logger.error(error_msg)
-        raise FileNotFoundError(error_msg)
+    _stat_input_file(input_path)
+
+    output_filename = get_output_filename(output_filename, output_format)
+    check_output_dependencies(output_format)
 
     if hadeg_database_path is None:
-        this_dir = os.path.dirname(os.path.abspath(__file__))
-        hadeg_database_path = os.path.normpath(
-            os.path.join(this_dir, "..", "data", "database_hadeg.csv")
+        hadeg_database_path = _DEFAULT_DB_PATHS["hadeg"]
+        logger.debug("Using default HADEG database path: %s", hadeg_database_path)
+
+    cache_key = None
+    if use_cache and save:
+        cache_key, cached_result = _check_output_cache(
+            input_path,
+            [hadeg_database_path],
+            output_dir,
+            output_filename,
+            add_timestamp,
+            ("hadeg", sep, optimize_types, output_format),
         )
-        logger.debug(f"Using default HADEG database path: {hadeg_database_path}")
+        if cached_result is not None:
+            return cached_result
 
-    logger.info(f"Reading input file: {input_path}")
-    with open(input_path, "r", encoding="utf-8") as f:
-        input_content = f.read()
+    hadeg_future = _prefetch_database(hadeg_database_path)
 
+    logger.info("Reading input file: %s", input_path)
     logger.info("Loading and merging input data with HADEG database")
-    df, error = load_and_merge_input(
-        input_content,
-        os.path.basename(input_path),
-        database_filepath=hadeg_database_path,
-        optimize_types=optimize_types,
-        merge_function=merge_input_with_hadeg,
-    )
+    with open(input_path, "r", encoding="utf-8") as input_file:
+        df, error = load_and_merge_input(
+            input_file,
+            os.path.basename(input_path),
+            database_filepath=hadeg_database_path,
+            optimize_types=optimize_types,
+            merge_function=merge_input_with_hadeg,
+            database_df=hadeg_future,
+        )
 
     if error:
         error_msg = f"HADEG Pipeline error: {error}"
         logger.error(error_msg)
         raise RuntimeError(error_msg)
 
-    logger.info(f"Saving merged DataFrame to: {output_dir}/{output_filename}")
+    if not save:
+        logger.info("Output saving skipped; returning the match count only")
+        return {
+            "output_path": None,
+            "matches": df.shape[0],
+            "filename": None,
+        }
+
+    logger.info("Saving merged DataFrame to: %s/%s", output_dir, output_filename)
     output_path = save_dataframe_output(
         df,
         output_dir=output_dir,
         filename=output_filename,
         sep=sep,
         add_timestamp=add_timestamp,
+        output_format=output_format,
     )
 
     logger.info(
-        f"HADEG Pipeline completed successfully. Output saved to: {output_path}"
+        "HADEG Pipeline completed successfully. Output saved to: %s", output_path
     )
 
+    matches = df.shape[0]
+    if cache_key is not None:
+        store_cached_output(cache_key, output_dir, output_path, matches)
+
     # Return structured data for user feedback
     return {
         "output_path": output_path,
-        "matches": len(df) if df is not None else 0,
+        "matches": matches,
         "filename": os.path.basename(output_path),
     }
 
@@ -462,6 +841,10 @@ def run_toxcsm_processing_pipeline(
     sep=";",
     optimize_types=True,
     add_timestamp=False,
+    output_format="txt",
+    use_cache=False,
+    context=None,
+    save=True,
 ):
     """
     Run complete ToxCSM toxicity prediction processing pipeline.
@@ -491,6 +874,24 @@ def run_toxcsm_processing_pipeline(
         for memory efficiency. Default: True.
     add_timestamp : bool, optional
         Whether to add timestamp to output filename. Default: False.
+    output_format : str, optional
+        Output file format: 'txt' (delimited text), 'parquet' or 'feather'.
+        For binary formats the output filename extension is replaced and
+        pyarrow is required. Default: 'txt'.
+    use_cache : bool, optional
+        Whether to reuse the output of a previous run with identical input
+        content, database files, options and BioRemPP version. Cached
+        outputs are kept under '<output_dir>/.cache', which holds the most
+        recently used entries and can be deleted to clear the cache.
+        Default: False.
+    context : PipelineContext, optional
+        Shared intermediate results for pipelines run on the same input.
+        The BioRemPP merge is reused from it if present, and is released
+        from it once used, since ToxCSM is its last consumer. Default: None.
+    save : bool, optional
+        Whether to write the merged DataFrame to disk. If False, nothing is
+        written, the output cache is not used, and 'output_path' and
+        'filename' are None in the result. Default: True.
 
     Returns
     -------
@@ -533,27 +934,22 @@ def run_toxcsm_processing_pipeline(
     - Optimized for environmental safety assessment
     - Requires 'cpd' column from BioRemPP processing stage
     """
-    logger.info(f"Starting ToxCSM processing pipeline for: {input_path}")
+    logger.info("Starting ToxCSM processing pipeline for: %s", input_path)
     logger.debug(
-        f"Pipeline parameters - toxcsm_database: {toxcsm_database_path}, "
-        f"output_dir: {output_dir}, optimize_types: {optimize_types}"
+        "Pipeline parameters - toxcsm_database: %s, output_dir: %s, optimize_types: %s",
+        toxcsm_database_path,
+        output_dir,
+        optimize_types,
     )
 
-    if not os.path.exists(input_path):
-        error_msg = f"Input file not found: {input_path}"
-        logger.error(error_msg)
-        raise FileNotFoundError(error_msg)
+    _stat_input_file(input_path)
 
-    if toxcsm_database_path is None:
-        this_dir = os.path.dirname(os.path.abspath(__file__))
-        toxcsm_database_path = os.path.normpath(
-            os.path.join(this_dir, "..", "data", "database_toxcsm.csv")
-        )
-        logger.debug(f"Using default ToxCSM database path: {toxcsm_database_path}")
+    output_filename = get_output_filename(output_filename, output_format)
+    check_output_dependencies(output_format)
 
-    logger.info(f"Reading input file: {input_path}")
-    with open(input_path, "r", encoding="utf-8") as f:
-        input_content = f.read()
+    if toxcsm_database_path is None:
+        toxcsm_database_path = _DEFAULT_DB_PATHS["toxcsm"]
+        logger.debug("Using default ToxCSM database path: %s", toxcsm_database_path)
 
     # Step 1: Process input through BioRemPP first to get 'cpd' column
     logger.info("Processing input data through BioRemPP pipeline")
@@ -566,11 +962,26 @@ def run_toxcsm_processing_pipeline(
             os.path.join(os.path.dirname(toxcsm_database_path), "database_biorempp.csv")
         )
 
-    df_biorempp, error = load_and_merge_input(
-        input_content,
-        os.path.basename(input_path),
-        optimize_types=optimize_types,
-        database_filepath=biorempp_db_path,
+    cache_key = None
+    if use_cache and save:
+        cache_key, cached_result = _check_output_cache(
+            input_path,
+            [biorempp_db_path, toxcsm_database_path],
+            output_dir,
+            output_filename,
+            add_timestamp,
+            ("toxcsm", sep, optimize_types, output_format),
+        )
+        if cached_result is not None:
+            if context is not None:
+                context.df_biorempp = None
+            return cached_result
+
+    # Load the ToxCSM database while the BioRemPP merge runs
+    toxcsm_future = _prefetch_database(toxcsm_database_path)
+
+    df_biorempp, error = _merge_with_biorempp(
+        input_path, biorempp_db_path, optimize_types, context=context
     )
 
     if error:
@@ -578,30 +989,199 @@ def run_toxcsm_processing_pipeline(
         logger.error(error_msg)
         raise RuntimeError(error_msg)
 
+    # ToxCSM is the last pipeline that needs the BioRemPP merge; drop the
+    # context's reference so that the ``del`` below actually frees it
+    if context is not None:
+        context.df_biorempp = None
+
     # Step 2: Merge BioRemPP result with ToxCSM database
     logger.info("Merging BioRemPP data with ToxCSM database")
     df = merge_input_with_toxcsm(
         df_biorempp,
         database_filepath=toxcsm_database_path,
         optimize_types=optimize_types,
+        database_df=toxcsm_future.result(),
     )
 
-    logger.info(f"Saving merged DataFrame to: {output_dir}/{output_filename}")
+    # The intermediate BioRemPP table is no longer needed; drop it so it is
+    # not kept alive alongside the (wider) ToxCSM result while saving
+    del df_biorempp
+
+    if not save:
+        logger.info("Output saving skipped; returning the match count only")
+        return {
+            "output_path": None,
+            "matches": df.shape[0],
+            "filename": None,
+        }
+
+    logger.info("Saving merged DataFrame to: %s/%s", output_dir, output_filename)
     output_path = save_dataframe_output(
         df,
         output_dir=output_dir,
         filename=output_filename,
         sep=sep,
         add_timestamp=add_timestamp,
+        output_format=output_format,
     )
 
     logger.info(
-        f"ToxCSM Pipeline completed successfully. Output saved to: {output_path}"
+        "ToxCSM Pipeline completed successfully. Output saved to: %s", output_path
     )
 
+    matches = df.shape[0]
+    if cache_key is not None:
+        store_cached_output(cache_key, output_dir, output_path, matches)
+
     # Return structured data for user feedback
     return {
         "output_path": output_path,
-        "matches": len(df) if df is not None else 0,
+        "matches": matches,
         "filename": os.path.basename(output_path),
     }
+
+
+# Pipeline functions and their database path keyword, by database name
+ALL_PIPELINES = {
+    "biorempp": (run_biorempp_processing_pipeline, "database_path"),
+    "hadeg": (run_hadeg_processing_pipeline, "hadeg_database_path"),
+    "kegg": (run_kegg_processing_pipeline, "kegg_database_path"),
+    "toxcsm": (run_toxcsm_processing_pipeline, "toxcsm_database_path"),
+}
+
+
+def raise_pipeline_failures(failures):
+    """
+    Raise the exceptions of failed database pipelines together.
+
+    Every exception gets a ``database`` attribute naming its pipeline, so
+    callers can report each failure separately. On Python 3.11+ they are
+    raised as an ``ExceptionGroup``, which can be handled with ``except*``.
+    On older versions a ``RuntimeError`` chained to the first failure is
+    raised instead; it exposes the same ``exceptions`` tuple.
+
+    Parameters
+    ----------
+    failures : list of tuple
+        ``(database_name, exception)`` pairs. Nothing is raised if empty.
+
+    Raises
+    ------
+    ExceptionGroup
+        If any pipeline failed (Python 3.11+).
+    RuntimeError
+        If any pipeline failed (Python < 3.11).
+    """
+    if not failures:
+        return
+
+    for db_name, exc in failures:
+        exc.database = db_name
+    exceptions = [exc for _, exc in failures]
+    message = "Pipeline failures: " + ", ".join(db_name for db_name, _ in failures)
+
+    if sys.version_info >= (3, 11):
+        raise ExceptionGroup(message, exceptions)  # noqa: F821
+
+    error = RuntimeError(message)
+    error.exceptions = tuple(exceptions)
+    raise error from exceptions[0]
+
+
+def run_all_processing_pipelines(
+    input_path,
+    database_paths=None,
+    output_dir="outputs/results_tables",
+    sep=";",
+    optimize_types=True,
+    add_timestamp=False,
+    output_format="txt",
+    max_workers=None,
+):
+    """
+    Run all database pipelines concurrently in separate worker processes.
+
+    The pipelines are independent (different databases and output files),
+    so each one runs in its own process. Every worker streams the input
+    file itself, so the parent never loads the input into memory.
+
+    Parameters
+    ----------
+    input_path : str
+        Path to the input .txt file.
+    database_paths : dict, optional
+        Custom database paths keyed by database name ('biorempp', 'hadeg',
+        'kegg', 'toxcsm'). Databases not listed use their default path.
+    output_dir : str, optional
+        Directory where the merged DataFrames will be saved.
+        Default: 'outputs/results_tables'.
+    sep : str, optional
+        Field separator for output files. Default: ';'.
+    optimize_types : bool, optional
+        Whether to optimize DataFrame dtypes. Default: True.
+    add_timestamp : bool, optional
+        Whether to add timestamp to output filenames. Default: False.
+    output_format : str, optional
+        Output file format: 'txt', 'parquet' or 'feather'. Default: 'txt'.
+    max_workers : int, optional
+        Number of worker processes. Default: one per pipeline, limited by
+        the number of CPUs.
+
+    Returns
+    -------
+    dict
+        Pipeline result dicts keyed by database name.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the input file does not exist.
+    ExceptionGroup
+        If any pipeline failed (Python 3.11+). Failures in one pipeline do
+        not stop the others; see :func:`raise_pipeline_failures`.
+    RuntimeError
+        If any pipeline failed (Python < 3.11).
+
+    Examples
+    --------
+    >>> results = run_all_processing_pipelines("sample_data.txt")
+    >>> print(results["biorempp"]["matches"])
+    """
+    _stat_input_file(input_path)
+
+    database_paths = database_paths or {}
+    if max_workers is None:
+        max_workers = min(len(ALL_PIPELINES), os.cpu_count() or 1)
+
+    logger.info(
+        "Running %d pipelines with %s worker(s) for: %s",
+        len(ALL_PIPELINES),
+        max_workers,
+        input_path,
+    )
+
+    results = {}
+    failures = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for db_name, (pipeline_func, path_kwarg) in ALL_PIPELINES.items():
+            futures[db_name] = executor.submit(
+                pipeline_func,
+                input_path,
+                output_dir=output_dir,
+                sep=sep,
+                optimize_types=optimize_types,
+                add_timestamp=add_timestamp,
+                output_format=output_format,
+                **{path_kwarg: database_paths.get(db_name)},
+            )
+
+        for db_name, future in futures.items():
+            try:
+                results[db_name] = future.result()
+                logger.info("Pipeline '%s' completed", db_name)
+            except Exception as e:
+                failures.append((db_name, e))
+
+    raise_pipeline_failures(failures)
+    return results
@@ -107,33 +107,56 @@ Example Usage
     feedback.show_progress("Processing data...")
 """
 
-from .enhanced_user_feedback import EnhancedFeedbackManager
-
-# Error handling
-from .error_handler import EnhancedErrorHandler, get_error_handler
-
-# I/O utilities
-from .io_utils import (
-    generate_timestamped_filename,
-    get_project_root,
-    resolve_output_path,
-    save_dataframe_output,
-)
-
-# Logging configuration
-from .logging_config import configure_from_env, get_logger, setup_logging
-
-# Silent logging for CLI
-from .silent_logging import get_logger as get_silent_logger
-from .silent_logging import setup_silent_logging, show_database_list, show_user_message
-
-# User feedback systems
-from .user_feedback import (
-    ProgressIndicator,
-    UserFeedbackManager,
-    get_user_feedback,
-    set_verbosity,
-)
+import importlib
+
+# Public names mapped to (submodule, attribute). Submodules are imported on
+# first access (PEP 562), so importing one utility module does not load the
+# others, or pandas, up front.
+_LAZY_EXPORTS = {
+    # DataFrame dtype utilities
+    "df_shrink": ("dtype_utils", "df_shrink"),
+    # Enhanced user feedback
+    "EnhancedFeedbackManager": ("enhanced_user_feedback", "EnhancedFeedbackManager"),
+    # Error handling
+    "EnhancedErrorHandler": ("error_handler", "EnhancedErrorHandler"),
+    "get_error_handler": ("error_handler", "get_error_handler"),
+    # I/O utilities
+    "generate_timestamped_filename": ("io_utils", "generate_timestamped_filename"),
+    "get_project_root": ("io_utils", "get_project_root"),
+    "resolve_output_path": ("io_utils", "resolve_output_path"),
+    "save_dataframe_output": ("io_utils", "save_dataframe_output"),
+    # Logging configuration
+    "configure_from_env": ("logging_config", "configure_from_env"),
+    "get_logger": ("logging_config", "get_logger"),
+    "setup_logging": ("logging_config", "setup_logging"),
+    # Silent logging for CLI
+    "get_silent_logger": ("silent_logging", "get_logger"),
+    "setup_silent_logging": ("silent_logging", "setup_silent_logging"),
+    "show_database_list": ("silent_logging", "show_database_list"),
+    "show_user_message": ("silent_logging", "show_user_message"),
+    # User feedback systems
+    "ProgressIndicator": ("user_feedback", "ProgressIndicator"),
+    "UserFeedbackManager": ("user_feedback", "UserFeedbackManager"),
+    "get_user_feedback": ("user_feedback", "get_user_feedback"),
+    "set_verbosity": ("user_feedback", "set_verbosity"),
+}
+
+
+def __getattr__(name):
+    """Import a public utility from its submodule on first access."""
+    try:
+        module_name, attr = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     # I/O utilities
@@ -141,6 +164,8 @@ __all__ = [
     "get_project_root",
     "resolve_output_path",
     "generate_timestamped_filename",
+    # Dtype utilities
+    "df_shrink",
     # Logging
     "get_logger",
     "setup_logging",
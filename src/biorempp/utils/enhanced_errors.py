@@ -111,7 +111,28 @@ Example Usage
     )
 """
 
-from typing import Dict, List, Optional, Tuple
+import re
+from typing import Dict, Optional, Sequence, Tuple
+
+# Context keywords, scanned in one pass. Each alternative sits in a
+# lookahead so that every occurrence is found, as with separate substring
+# checks; no two keywords can start at the same position. Matching is
+# case-insensitive, so the message is not lowercased first.
+_CONTEXT_KEYWORDS = re.compile(
+    r"(?=(?P<db>biorempp|hadeg|kegg|toxcsm)"
+    r"|(?P<database>database)"
+    r"|(?P<csv>\.csv)"
+    r"|(?P<input>input|sample_data)"
+    r"|(?P<output>output|results)"
+    r"|(?P<log>log)"
+    r"|(?P<column>column|key)"
+    r"|(?P<empty>empty|no data)"
+    r"|(?P<import>import|module)"
+    r"|(?P<format>format)"
+    r"|(?P<invalid>invalid)"
+    r"|(?P<wrong>wrong))",
+    re.IGNORECASE,
+)
 
 
 class EnhancedErrorHandler:
@@ -121,12 +142,12 @@ class EnhancedErrorHandler:
         "FileNotFoundError": {
             "input_file": {
                 "message": "Input file not found",
-                "solutions": [
+                "solutions": (
                     "Check if the file path is correct",
                     "Ensure the file exists in the specified location",
                     "Use absolute path if necessary",
                     "Verify file permissions",
-                ],
+                ),
                 "example": (
                     "biorempp --input /full/path/to/your_data.txt "
                     "--database biorempp"
@@ -134,7 +155,7 @@ class EnhancedErrorHandler:
             },
             "database_file": {
                 "message": "Database file not found",
-                "solutions": [
+                "solutions": (
                     "Database files may be missing or corrupted",
                     "Try reinstalling BioRemPP package",
                     (
@@ -142,19 +163,19 @@ class EnhancedErrorHandler:
                         "in src/biorempp/data/"
                     ),
                     "Verify package installation integrity",
-                ],
+                ),
                 "example": "biorempp --list-databases",
             },
         },
         "PermissionError": {
             "output_dir": {
                 "message": "Permission denied for output directory",
-                "solutions": [
+                "solutions": (
                     "Choose a different output directory",
                     "Check write permissions for the directory",
                     "Try running with administrator privileges",
                     "Create the directory manually first",
-                ],
+                ),
                 "example": (
                     "biorempp --input data.txt --database biorempp "
                     "--output-dir ~/my_results"
@@ -162,35 +183,35 @@ class EnhancedErrorHandler:
             },
             "log_dir": {
                 "message": "Permission denied for log directory",
-                "solutions": [
+                "solutions": (
                     "Create logs directory manually: mkdir outputs/logs",
                     "Check write permissions for outputs/ directory",
                     "Try running with administrator privileges",
-                ],
+                ),
                 "example": "mkdir -p outputs/logs",
             },
         },
         "ValueError": {
             "invalid_database": {
                 "message": "Invalid database name",
-                "solutions": [
+                "solutions": (
                     (
                         "Use one of the available databases: "
                         "biorempp, hadeg, kegg, toxcsm"
                     ),
                     "Check spelling of database name (case-sensitive)",
                     "Use --list-databases to see all available options",
-                ],
+                ),
                 "example": "biorempp --input data.txt --database biorempp",
             },
             "invalid_format": {
                 "message": "Invalid file format",
-                "solutions": [
+                "solutions": (
                     "Ensure input file contains valid identifiers",
                     "Check if file contains KO identifiers (one per line)",
                     "Verify file encoding is UTF-8",
                     "Remove any special characters or formatting",
-                ],
+                ),
                 "example": (
                     "Check sample_data.txt in src/biorempp/data/ "
                     "for format reference"
@@ -198,47 +219,47 @@ class EnhancedErrorHandler:
             },
             "empty_input": {
                 "message": "Input file is empty or contains no valid data",
-                "solutions": [
+                "solutions": (
                     "Verify the input file contains data",
                     "Check file format and content",
                     "Ensure identifiers are properly formatted",
-                ],
+                ),
                 "example": "Input file should contain one identifier per line",
             },
         },
         "KeyError": {
             "missing_column": {
                 "message": "Required column missing from database",
-                "solutions": [
+                "solutions": (
                     "Database file may be corrupted",
                     "Try reinstalling BioRemPP package",
                     "Check database file integrity",
-                ],
+                ),
                 "example": "biorempp --database-info biorempp",
             }
         },
         "pd.errors.EmptyDataError": {
             "empty_database": {
                 "message": "Database file is empty or corrupted",
-                "solutions": [
+                "solutions": (
                     "Database file may be corrupted",
                     "Try reinstalling BioRemPP package",
                     "Check if database file exists and has content",
-                ],
+                ),
                 "example": "biorempp --list-databases",
             }
         },
         "ImportError": {
             "missing_dependency": {
                 "message": "Required dependency not found",
-                "solutions": [
+                "solutions": (
                     (
                         "Install missing dependencies with: "
                         "pip install -r requirements.txt"
                     ),
                     "Check if pandas is installed: pip install pandas",
                     "Verify Python environment is properly configured",
-                ],
+                ),
                 "example": "pip install biorempp[all]",
             }
         },
@@ -266,13 +287,21 @@ class EnhancedErrorHandler:
             Tuple of (user_message, solution_text)
         """
         error_type = type(error).__name__
-        error_message = str(error)
+        # str(error) is only needed to derive a context or for the fallback
+        error_message = None
 
-        # Try to determine context from error message if not provided
-        if not context:
+        # Try to determine context from error message if not provided;
+        # error types without solutions always take the fallback below
+        if not context and error_type in self.ERROR_SOLUTIONS:
+            error_message = str(error)
             context = self._determine_context(error_message, error_type)
 
-        # Get predefined solution
+        # Get predefined solution, formatted once at import time
+        formatted = self._FORMATTED_SOLUTIONS.get(error_type, {}).get(context)
+        if formatted is not None:
+            return formatted
+
+        # Entries added to ERROR_SOLUTIONS at runtime are formatted on demand
         solution_info = self._get_solution_info(error_type, context)
 
         if solution_info:
@@ -284,37 +313,37 @@ class EnhancedErrorHandler:
             return user_message, solution_text
 
         # Fallback for unknown errors
+        if error_message is None:
+            error_message = str(error)
         fallback_solution = self._get_generic_solution(error_type)
         return (f"An unexpected error occurred: {error_message}", fallback_solution)
 
     def _determine_context(self, error_message: str, error_type: str) -> str:
         """Determine error context from error message and type."""
-        error_lower = error_message.lower()
+        found = {m.lastgroup for m in _CONTEXT_KEYWORDS.finditer(error_message)}
 
         # Database-related contexts (check first before generic "invalid")
-        if "database" in error_lower and (
-            "invalid" in error_lower or "wrong" in error_lower
-        ):
+        if "database" in found and ("invalid" in found or "wrong" in found):
             return "invalid_database"
-        elif any(db in error_lower for db in ["biorempp", "hadeg", "kegg", "toxcsm"]):
-            if "database" in error_lower or ".csv" in error_lower:
+        elif "db" in found:
+            if "database" in found or "csv" in found:
                 return "database_file"
 
             else:
                 return "invalid_database"
 
         # File-related contexts
-        elif "input" in error_lower or "sample_data" in error_lower:
+        elif "input" in found:
             return "input_file"
-        elif "output" in error_lower or "results" in error_lower:
+        elif "output" in found:
             return "output_dir"
-        elif "log" in error_lower:
+        elif "log" in found:
             return "log_dir"
 
         # Data-related contexts
-        elif "column" in error_lower or "key" in error_lower:
+        elif "column" in found:
             return "missing_column"
-        elif "empty" in error_lower or "no data" in error_lower:
+        elif "empty" in found:
             if error_type == "ValueError":
                 return "empty_input"
 
@@ -322,11 +351,11 @@ class EnhancedErrorHandler:
                 return "empty_database"
 
         # Import-related contexts
-        elif "import" in error_lower or "module" in error_lower:
+        elif "import" in found:
             return "missing_dependency"
 
         # Format-related contexts (check after database contexts)
-        elif "format" in error_lower or "invalid" in error_lower:
+        elif "format" in found or "invalid" in found:
             return "invalid_format"
 
         return "general"
@@ -339,7 +368,8 @@ class EnhancedErrorHandler:
 
         return None
 
-    def _format_solution(self, solutions: List[str], example: str = None) -> str:
+    @staticmethod
+    def _format_solution(solutions: Sequence[str], example: str = None) -> str:
         """Format solution text for display."""
         solution_lines = []
         for i, solution in enumerate(solutions, 1):
@@ -352,6 +382,20 @@ class EnhancedErrorHandler:
 
         return solution_text
 
+    @classmethod
+    def _build_formatted_table(cls) -> Dict[str, Dict[str, Tuple[str, str]]]:
+        """Format every ERROR_SOLUTIONS entry as (user_message, solution_text)."""
+        return {
+            error_type: {
+                context: (
+                    info["message"],
+                    cls._format_solution(info["solutions"], info.get("example")),
+                )
+                for context, info in contexts.items()
+            }
+            for error_type, contexts in cls.ERROR_SOLUTIONS.items()
+        }
+
     def _get_generic_solution(self, error_type: str) -> str:
         """Get generic solution for unknown error types."""
         generic_solutions = {
@@ -399,13 +443,28 @@ class EnhancedErrorHandler:
         return " | ".join(context_parts)
 
 
+# ERROR_SOLUTIONS is static, so its display text is built once
+EnhancedErrorHandler._FORMATTED_SOLUTIONS = (
+    EnhancedErrorHandler._build_formatted_table()
+)
+
+
 # Global error handler instance
-_global_error_handler = None
+# Created at import time: the handler only reads class-level tables, so
+# sharing one instance is safe and needs no lazy, racy initialisation.
+_global_error_handler = EnhancedErrorHandler()
 
 
 def get_error_handler(feedback_manager=None) -> EnhancedErrorHandler:
-    """Get enhanced error handler instance."""
-    global _global_error_handler
-    if _global_error_handler is None:
-        _global_error_handler = EnhancedErrorHandler(feedback_manager)
+    """
+    Get enhanced error handler instance.
+
+    Parameters
+    ----------
+    feedback_manager : optional
+        Feedback manager to attach to the shared handler. Only the first one
+        passed is attached; later ones are ignored.
+    """
+    if _global_error_handler.feedback_manager is None:
+        _global_error_handler.feedback_manager = feedback_manager
     return _global_error_handler
@@ -87,75 +87,301 @@ Example Usage
     logger.user_success("✅ Analysis completed successfully")
 """
 
+from __future__ import annotations
+
+import atexit
 import logging
 import logging.handlers
+import os
+import queue
 import sys
 import threading
 import time
-from datetime import datetime
-from pathlib import Path
-from typing import Any, Dict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+
+def _resolve_level(name: str) -> int:
+    """Return the numeric logging level for a level name such as 'WARN'."""
+    level = getattr(logging, name, None)
+    if not isinstance(level, int):
+        raise ValueError(f"Unknown log level: {name}")
+    return level
+
+
+class _CachedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    Rotating file handler that keeps a running count of the file size.
+
+    The stock handler stats the log path and seeks the stream for every
+    record. This one checks once per opened file whether it is a regular
+    file and only asks the stream for its real size when the running count
+    reaches ``maxBytes``.
+    """
+
+    def _open(self):
+        stream = super()._open()
+        self._is_regular_file = os.path.isfile(self.baseFilename)
+        stream.seek(0, 2)
+        self._size = stream.tell()
+        return stream
+
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0 or not self._is_regular_file:
+            return False
+
+        msg = "%s\n" % self.format(record)
+        if msg.isascii():
+            msg_size = len(msg)
+        else:
+            msg_size = len(msg.encode(self.encoding or "utf-8", "replace"))
 
+        if self._size + msg_size >= self.maxBytes:
+            # Near the limit: resynchronise with the real file size
+            self.stream.seek(0, 2)
+            self._size = self.stream.tell()
+            if self._size + msg_size >= self.maxBytes:
+                # Reopening resets the running count to the new file's size
+                self.doRollover()
 
-class BioRemPPLogger:
-    """Dual logging system: technical file logs + clean user console feedback."""
+        self._size += msg_size
+        return False
 
-    def __init__(
-        self,
-        console_level: str = "NORMAL",
-        file_level: str = "INFO",
-        log_dir: str = "outputs/logs",
-    ):
-        self.console_level = console_level.upper()
-        self.file_level = file_level.upper()
-        self.log_dir = Path(log_dir)
 
-        # Threading for spinners
-        self._spinner_active = False
-        self._spinner_thread = None
+class _DropOldestQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that discards the oldest record when the queue is full.
+
+    Bounding the queue caps memory when records arrive faster than the
+    listener can write them, while keeping the most recent records.
+    """
+
+    def __init__(self, queue):
+        super().__init__(queue)
+        self.dropped_count = 0
+
+    def enqueue(self, record):
+        while True:
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                try:
+                    self.queue.get_nowait()
+                except queue.Empty:
+                    continue
+                self.queue.task_done()
+                self.dropped_count += 1
+
+
+class _BoundedQueueListener(logging.handlers.QueueListener):
+    """Queue listener whose stop() waits for room in a bounded queue."""
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
 
-        # Technical logger for file logging
-        self.technical_logger = None
 
-        self._setup_logging()
+class _CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that converts each record timestamp second only once.
+
+    Consecutive records usually share the same second, so the
+    ``time.strftime`` result is reused and only the milliseconds are
+    appended per record.
+    """
+
+    _cached_time = (None, "")
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+
+        second = int(record.created)
+        cached_second, text = self._cached_time
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(second))
+            self._cached_time = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+
+class _TechnicalLogFormatter(_CachedTimeFormatter):
+    """
+    Technical log formatter that renders the extra field of user messages.
+
+    User messages carry a ``(label, value)`` pair in ``record.user_field``
+    instead of formatting it into the message, so the value is only
+    converted to text on the listener thread, for records that are kept.
+    """
+
+    def formatMessage(self, record):
+        text = super().formatMessage(record)
+        user_field = getattr(record, "user_field", None)
+        if user_field is not None:
+            label, value = user_field
+            text = f"{text} | {label}: {value}"
+        return text
+
+
+class _TechnicalLog:
+    """
+    Handlers behind the shared ``biorempp.technical`` logger.
+
+    The logger only enqueues records; a listener thread passes them through
+    a memory buffer to a rotating file in ``log_dir``.
+    """
+
+    def __init__(self, file_level: str, log_dir: str, console_level: str):
+        self.key = (file_level, log_dir)
 
-    def _setup_logging(self):
-        """Setup both file and console logging."""
         # Create log directory
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        os.makedirs(log_dir, exist_ok=True)
 
         # Setup file logging (technical)
-        log_file = self.log_dir / f"biorempp_{datetime.now().strftime('%Y%m%d')}.log"
+        log_file = os.path.join(log_dir, f"biorempp_{time.strftime('%Y%m%d')}.log")
+
+        level = _resolve_level(file_level)
 
         # Create technical logger
-        self.technical_logger = logging.getLogger("biorempp.technical")
-        self.technical_logger.setLevel(getattr(logging, self.file_level))
+        self.logger = logging.getLogger("biorempp.technical")
+        self.logger.setLevel(level)
 
         # Remove existing handlers to avoid duplicates
-        self.technical_logger.handlers.clear()
+        self.logger.handlers.clear()
 
-        # File handler with rotation
-        file_handler = logging.handlers.RotatingFileHandler(
+        # File handler with rotation, owned by the queue listener thread
+        file_handler = _CachedRotatingFileHandler(
             log_file, maxBytes=10 * 1024 * 1024, backupCount=7, encoding="utf-8"  # 10MB
         )
 
-        file_formatter = logging.Formatter(
+        file_formatter = _TechnicalLogFormatter(
             "%(asctime)s | %(levelname)-8s | %(name)-25s | "
             "%(funcName)-15s | %(lineno)-4d | %(message)s"
         )
         file_handler.setFormatter(file_formatter)
-        file_handler.setLevel(getattr(logging, self.file_level))
+        file_handler.setLevel(level)
+
+        # Buffer records and write them in batches; errors are written at once
+        buffer_handler = logging.handlers.MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True,
+        )
+        buffer_handler.setLevel(level)
 
-        self.technical_logger.addHandler(file_handler)
+        # Callers only enqueue records; formatting and disk writes happen
+        # on the listener thread
+        log_queue = queue.Queue(maxsize=10000)
+        self.listener = _BoundedQueueListener(
+            log_queue, buffer_handler, respect_handler_level=True
+        )
+        self.listener.start()
+
+        self.queue_handler = _DropOldestQueueHandler(log_queue)
+        self.logger.addHandler(self.queue_handler)
 
         # Prevent technical logs from going to root logger (no console spam)
-        self.technical_logger.propagate = False
+        self.logger.propagate = False
 
         # Log system initialization
-        self.technical_logger.info("Enhanced logging system initialized")
-        self.technical_logger.info(
-            f"Console level: {self.console_level}, File level: {self.file_level}"
-        )
+        self.logger.info("Enhanced logging system initialized")
+        self.logger.info("Console level: %s, File level: %s", console_level, file_level)
+
+    def close(self):
+        """Write pending records to the log file and stop the listener."""
+        dropped = self.queue_handler.dropped_count
+        if dropped:
+            self.logger.warning(
+                "%d technical log records were dropped (log queue full)", dropped
+            )
+
+        self.listener.stop()
+        for buffer_handler in self.listener.handlers:
+            # Closing the buffer flushes it but leaves its target open
+            file_handler = buffer_handler.target
+            buffer_handler.close()
+            file_handler.close()
+
+
+# Technical log shared by all BioRemPPLogger instances
+_technical_log = None
+_technical_log_lock = threading.Lock()
+
+
+def _get_technical_log(
+    file_level: str, log_dir: str, console_level: str
+) -> _TechnicalLog:
+    """Return the shared technical log, (re)configuring it if needed."""
+    global _technical_log
+    with _technical_log_lock:
+        current = _technical_log
+        if current is None or current.key != (file_level, log_dir):
+            if current is not None:
+                current.close()
+            _technical_log = _TechnicalLog(file_level, log_dir, console_level)
+        return _technical_log
+
+
+def _close_technical_log(technical_log: _TechnicalLog = None):
+    """Close the shared technical log, or only if it is ``technical_log``."""
+    global _technical_log
+    with _technical_log_lock:
+        current = _technical_log
+        if current is None or technical_log not in (None, current):
+            return
+        current.close()
+        _technical_log = None
+
+
+atexit.register(_close_technical_log)
+
+
+class BioRemPPLogger:
+    """Dual logging system: technical file logs + clean user console feedback."""
+
+    # kind -> (console prefix, log level, label of the extra log field)
+    _USER_MESSAGES = {
+        "success": ("✅", logging.INFO, "Details"),
+        "warning": ("⚠️  Warning:", logging.WARNING, "Suggestion"),
+        "error": ("[ERROR] Error:", logging.ERROR, "Solution"),
+    }
+
+    def __init__(
+        self,
+        console_level: str = "NORMAL",
+        file_level: str = "INFO",
+        log_dir: str = "outputs/logs",
+    ):
+        self.console_level = console_level.upper()
+        self.file_level = file_level.upper()
+        # Fail here rather than at the first log call
+        _resolve_level(self.file_level)
+        self.log_dir = os.fspath(log_dir)
+
+        # Threading for spinners, animated only on interactive terminals
+        self._tty = sys.stdout.isatty()
+        self._spinner_stop = threading.Event()
+        self._spinner_thread = None
+
+        # Shared technical log, set up on first use so that runs which
+        # never log create no directory or file
+        self._technical_log = None
+
+    @property
+    def technical_logger(self) -> logging.Logger:
+        """Technical file logger, configured on first access."""
+        technical_log = self._technical_log
+        # Set up on first use, or again if the shared log was closed or
+        # reconfigured by another instance
+        if technical_log is None or technical_log is not _technical_log:
+            technical_log = self._technical_log = _get_technical_log(
+                self.file_level, self.log_dir, self.console_level
+            )
+        return technical_log.logger
 
     def user_info(self, message: str, icon: str = "ℹ️", show_spinner: bool = False):
         """Show info message to user with optional spinner."""
@@ -169,46 +395,48 @@ class BioRemPPLogger:
             print(f"{icon} {message}")
 
         # Log to file
-        self.technical_logger.info(f"USER_INFO: {message}")
+        self.technical_logger.info("USER_INFO: %s", message)
 
-    def user_success(self, message: str, details: Dict[str, Any] = None):
+    def user_success(self, message: str, details: dict[str, Any] = None):
         """Show success message to user."""
         if self.console_level == "SILENT":
             return
 
-        self._stop_spinner()
-        print(f"✅ {message}")
-
+        extra_lines = ()
         if details and self.console_level == "VERBOSE":
-            for key, value in details.items():
-                print(f"   📊 {key}: {value}")
+            extra_lines = [f"   📊 {key}: {value}" for key, value in details.items()]
 
-        self.technical_logger.info(f"USER_SUCCESS: {message} | Details: {details}")
+        self._emit("success", message, details, extra_lines)
 
     def user_warning(self, message: str, suggestion: str = None):
         """Show warning to user with optional suggestion."""
         if self.console_level == "SILENT":
             return
 
-        self._stop_spinner()
-        print(f"⚠️  Warning: {message}")
-
-        if suggestion:
-            print(f"💡 Suggestion: {suggestion}")
-
-        self.technical_logger.warning(
-            f"USER_WARNING: {message} | Suggestion: {suggestion}"
-        )
+        extra_lines = (f"💡 Suggestion: {suggestion}",) if suggestion else ()
+        self._emit("warning", message, suggestion, extra_lines)
 
     def user_error(self, message: str, solution: str = None):
         """Show error to user with optional solution."""
-        self._stop_spinner()
-        print(f"[ERROR] Error: {message}")
+        extra_lines = (f"💡 Solution:\n{solution}",) if solution else ()
+        self._emit("error", message, solution, extra_lines)
 
-        if solution:
-            print(f"💡 Solution:\n{solution}")
+    def _emit(self, kind, message, extra, extra_lines=()):
+        """Print a user message of the given kind and record it in the log."""
+        prefix, level, label = self._USER_MESSAGES[kind]
 
-        self.technical_logger.error(f"USER_ERROR: {message} | Solution: {solution}")
+        self._stop_spinner()
+        print("\n".join((f"{prefix} {message}", *extra_lines)))
+
+        # stacklevel=2 attributes the record to the calling user_* method
+        self.technical_logger.log(
+            level,
+            "USER_%s: %s",
+            kind.upper(),
+            message,
+            extra={"user_field": (label, extra)},
+            stacklevel=2,
+        )
 
     def debug(self, message: str):
         """Log debug message to file only."""
@@ -230,22 +458,42 @@ class BioRemPPLogger:
         """Log critical message to file only."""
         self.technical_logger.critical(message, exc_info=exc_info)
 
+    def close(self):
+        """Write pending records to the log file and stop the listener."""
+        if self._technical_log is None:
+            return
+
+        _close_technical_log(self._technical_log)
+        self._technical_log = None
+
     def _start_spinner(self, message: str):
         """Start spinner animation."""
         if self.console_level == "SILENT":
             return
 
-        self._spinner_active = True
-        spinner_chars = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+        # Carriage-return animation only clutters redirected output
+        if not self._tty:
+            print(message)
+            return
+
+        self._stop_spinner()
+        stop = self._spinner_stop = threading.Event()
+
+        # Every frame is built once; each tick is a single write
+        frames = [f"\r{char} {message}" for char in "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"]
+        clear = "\r" + " " * (len(message) + 2) + "\r"
 
         def spin():
             i = 0
-            while self._spinner_active:
-                sys.stdout.write(f"\r{spinner_chars[i % len(spinner_chars)]} {message}")
+            # Fixed deadlines keep the cadence steady despite write latency
+            deadline = time.monotonic()
+            while not stop.is_set():
+                sys.stdout.write(frames[i % len(frames)])
                 sys.stdout.flush()
-                time.sleep(0.1)
+                deadline += 0.1
+                stop.wait(max(0.0, deadline - time.monotonic()))
                 i += 1
-            sys.stdout.write("\r" + " " * (len(message) + 2) + "\r")
+            sys.stdout.write(clear)
             sys.stdout.flush()
 
         self._spinner_thread = threading.Thread(target=spin)
@@ -254,13 +502,14 @@ class BioRemPPLogger:
 
     def _stop_spinner(self):
         """Stop spinner animation."""
-        self._spinner_active = False
+        self._spinner_stop.set()
         if self._spinner_thread:
-            self._spinner_thread.join(timeout=0.2)
+            self._spinner_thread.join(timeout=0.15)
 
 
-# Global logger instance
+# Global logger instance, created once under the lock
 _global_logger = None
+_global_logger_lock = threading.Lock()
 
 
 def get_enhanced_logger(
@@ -268,16 +517,22 @@ def get_enhanced_logger(
 ) -> BioRemPPLogger:
     """Get enhanced logger instance (singleton)."""
     global _global_logger
-    if _global_logger is None:
-        _global_logger = BioRemPPLogger(console_level, file_level)
-    return _global_logger
+    logger = _global_logger
+    if logger is not None:
+        return logger
+
+    with _global_logger_lock:
+        if _global_logger is None:
+            _global_logger = BioRemPPLogger(console_level, file_level)
+        return _global_logger
 
 
 def set_console_level(level: str):
     """Set console verbosity level globally."""
     global _global_logger
-    if _global_logger:
-        _global_logger.console_level = level.upper()
+    with _global_logger_lock:
+        if _global_logger:
+            _global_logger.console_level = level.upper()
 
-    else:
-        _global_logger = BioRemPPLogger(level.upper())
+        else:
+            _global_logger = BioRemPPLogger(level.upper())
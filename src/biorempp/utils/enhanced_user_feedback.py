@@ -74,7 +74,31 @@ Example Usage
     feedback.show_final_summary(results, elapsed_time=1.2)
 """
 
-from typing import Any, Dict
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+# Console blocks filled in once per database and once per run
+_DB_LINES_TEMPLATE = (
+    "[PROCESS] Processing databases [{}/4]:\n"
+    "   [DB] {} Database...      OK {:,} matches -> {}"
+)
+_SUMMARY_LINES_TEMPLATE = (
+    "[SUCCESS] All databases processed successfully!\n"
+    "   [RESULTS] Total results: {:,} matches across {} databases\n"
+    "   [OUTPUT] Location: outputs/results_tables/\n"
+    "   [TIME] Total time: {:.1f} seconds"
+)
+
+
+def _write_lines(lines):
+    """Write a block of console lines with a single write and flush."""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 class EnhancedFeedbackManager:
@@ -85,136 +109,143 @@ class EnhancedFeedbackManager:
     specification from LOGGING_SYSTEM_DESIGN.md.
     """
 
+    # (result key, display name) in processing order
+    DB_ENTRIES = (
+        ("biorempp", "BioRemPP"),
+        ("hadeg", "HAdeg"),
+        ("kegg", "KEGG"),
+        ("toxcsm", "ToxCSM"),
+    )
+
     def __init__(self, verbosity: str = "NORMAL"):
         """Initialize feedback manager."""
-        self.verbosity = verbosity.upper()
-        self.db_order = ["biorempp", "hadeg", "kegg", "toxcsm"]
-        self.db_names = {
-            "biorempp": "BioRemPP",
-            "hadeg": "HAdeg",
-            "kegg": "KEGG",
-            "toxcsm": "ToxCSM",
-        }
+        self.verbosity = verbosity
+
+    @property
+    def verbosity(self) -> str:
+        """Verbosity level: 'SILENT', 'NORMAL' or 'DEBUG'."""
+        return self._verbosity
+
+    @verbosity.setter
+    def verbosity(self, value: str) -> None:
+        self._verbosity = value.upper()
+        # Resolved here so the show_* guards are plain attribute checks
+        self._silent = self._verbosity == "SILENT"
+        self._debug = self._verbosity == "DEBUG"
 
     def show_header(self) -> None:
         """Display the header."""
-        if self.verbosity == "SILENT":
+        if self._silent:
             return
 
-        print("\n[BIOREMPP] Processing with ALL Databases")
-        print("=" * 67)
+        lines = ["\n[BIOREMPP] Processing with ALL Databases", "=" * 67]
 
         # Debug mode shows technical details
-        if self.verbosity == "DEBUG":
-            print(f"🔧 [DEBUG] Verbosity level: {self.verbosity}")
-            print(f"🔧 [DEBUG] Available databases: {list(self.db_names.keys())}")
-            print(f"🔧 [DEBUG] Processing order: {self.db_order}")
+        if self._debug:
+            lines.append(f"🔧 [DEBUG] Verbosity level: {self.verbosity}")
+            db_keys = [db_key for db_key, _ in self.DB_ENTRIES]
+            lines.append(f"🔧 [DEBUG] Available databases: {db_keys}")
+            lines.append(f"🔧 [DEBUG] Processing order: {db_keys}")
 
-        print()
+        lines.append("")
+        _write_lines(lines)
 
     def show_input_loaded(self, line_count: int) -> None:
         """Display input loading status."""
-        if self.verbosity == "SILENT":
+        if self._silent:
             return
 
         if line_count > 0:
-            print(
+            lines = [
                 f"[LOAD] Loading input data...        "
                 f"OK {line_count:,} KO identifiers loaded"
-            )
+            ]
 
             # Debug mode shows technical details
-            if self.verbosity == "DEBUG":
-                print("🔧 [DEBUG] Input file processing completed")
-                print(f"🔧 [DEBUG] Total KO identifiers parsed: {line_count:,}")
+            if self._debug:
+                lines.append("🔧 [DEBUG] Input file processing completed")
+                lines.append(f"🔧 [DEBUG] Total KO identifiers parsed: {line_count:,}")
 
         else:
-            print("[LOAD] Loading input data...        OK Input loaded")
+            lines = ["[LOAD] Loading input data...        OK Input loaded"]
 
-            if self.verbosity == "DEBUG":
-                print("🔧 [DEBUG] Empty or minimal input detected")
+            if self._debug:
+                lines.append("🔧 [DEBUG] Empty or minimal input detected")
 
-        print()
+        lines.append("")
+        _write_lines(lines)
 
-    def show_database_processing(self, result: Dict[str, Any]) -> None:
+    def show_database_processing(self, result: dict[str, Any]) -> None:
         """Display database processing steps with real data."""
-        if self.verbosity == "SILENT":
+        if self._silent:
             return
 
-        for i, db_key in enumerate(self.db_order, 1):
-            if db_key in result:
-                pipeline_result = result[db_key]
-                if (
-                    isinstance(pipeline_result, dict)
-                    and "output_path" in pipeline_result
-                ):
-                    filename = pipeline_result.get("filename", "Unknown")
-                    matches = pipeline_result.get("matches", 0)
+        lines = []
+        for i, (db_key, db_name) in enumerate(self.DB_ENTRIES, 1):
+            pipeline_result = result.get(db_key)
+            if not (
+                isinstance(pipeline_result, dict) and "output_path" in pipeline_result
+            ):
+                continue
+
+            filename = pipeline_result.get("filename", "Unknown")
+            matches = pipeline_result.get("matches", 0)
 
-                    print(f"[PROCESS] Processing databases [{i}/4]:")
-                    print(
-                        f"   [DB] {self.db_names.get(db_key, db_key)} "
-                        f"Database...      OK {matches:,} matches -> "
-                        f"{filename}"
-                    )
-
-                    # Debug mode shows technical details
-                    if self.verbosity == "DEBUG":
-                        output_path = pipeline_result.get("output_path", "Unknown")
-                        print(f"🔧 [DEBUG] Database: {db_key}")
-                        print(f"🔧 [DEBUG] Output path: {output_path}")
-                        print(
-                            f"🔧 [DEBUG] Result type: {type(pipeline_result).__name__}"
-                        )
-                        if "processing_time" in pipeline_result:
-                            time_val = pipeline_result["processing_time"]
-                            print(f"🔧 [DEBUG] Processing time: {time_val:.2f}s")
-
-                    print()
-
-    def show_final_summary(self, result: Dict[str, Any], elapsed_time: float) -> None:
+            lines.append(_DB_LINES_TEMPLATE.format(i, db_name, matches, filename))
+
+            # Debug mode shows technical details
+            if self._debug:
+                output_path = pipeline_result.get("output_path", "Unknown")
+                lines.append(f"🔧 [DEBUG] Database: {db_key}")
+                lines.append(f"🔧 [DEBUG] Output path: {output_path}")
+                lines.append(
+                    f"🔧 [DEBUG] Result type: {type(pipeline_result).__name__}"
+                )
+                if "processing_time" in pipeline_result:
+                    time_val = pipeline_result["processing_time"]
+                    lines.append(f"🔧 [DEBUG] Processing time: {time_val:.2f}s")
+
+            lines.append("")
+
+        if lines:
+            _write_lines(lines)
+
+    def show_final_summary(self, result: dict[str, Any], elapsed_time: float) -> None:
         """Display final summary with real data."""
-        if self.verbosity == "SILENT":
+        if self._silent:
             return
 
         # Calculate total matches
         total_matches = 0
         database_count = 0
 
-        for db_key in self.db_order:
-            if db_key in result:
-                pipeline_result = result[db_key]
-                if (
-                    isinstance(pipeline_result, dict)
-                    and "output_path" in pipeline_result
-                ):
-                    matches = pipeline_result.get("matches", 0)
-                    total_matches += matches
-                    database_count += 1
+        for db_key, _ in self.DB_ENTRIES:
+            pipeline_result = result.get(db_key)
+            if isinstance(pipeline_result, dict) and "output_path" in pipeline_result:
+                total_matches += pipeline_result.get("matches", 0)
+                database_count += 1
 
-        print("[SUCCESS] All databases processed successfully!")
-        print(
-            f"   [RESULTS] Total results: {total_matches:,} matches across "
-            f"{database_count} databases"
-        )
-        print("   [OUTPUT] Location: outputs/results_tables/")
-        print(f"   [TIME] Total time: {elapsed_time:.1f} seconds")
+        lines = [
+            _SUMMARY_LINES_TEMPLATE.format(total_matches, database_count, elapsed_time)
+        ]
 
         # Debug mode shows technical summary
-        if self.verbosity == "DEBUG":
-            print("🔧 [DEBUG] ===== TECHNICAL SUMMARY =====")
-            db_count = len(self.db_order)
-            print(f"🔧 [DEBUG] Processed databases: {database_count}/{db_count}")
-            print(f"🔧 [DEBUG] Total processing time: {elapsed_time:.3f} seconds")
+        if self._debug:
+            lines.append("🔧 [DEBUG] ===== TECHNICAL SUMMARY =====")
+            db_count = len(self.DB_ENTRIES)
+            lines.append(f"🔧 [DEBUG] Processed databases: {database_count}/{db_count}")
+            lines.append(
+                f"🔧 [DEBUG] Total processing time: {elapsed_time:.3f} seconds"
+            )
             avg_time = elapsed_time / max(database_count, 1)
-            print(f"🔧 [DEBUG] Average time per database: {avg_time:.3f}s")
+            lines.append(f"🔧 [DEBUG] Average time per database: {avg_time:.3f}s")
             matches_per_sec = total_matches / max(elapsed_time, 0.001)
-            print(f"🔧 [DEBUG] Matches per second: {matches_per_sec:.1f}")
-            for db_key in self.db_order:
-                if db_key in result:
-                    pipeline_result = result[db_key]
-                    if isinstance(pipeline_result, dict):
-                        matches = pipeline_result.get("matches", 0)
-                        print(f"🔧 [DEBUG] {db_key}: {matches:,} matches")
-
-        print()
+            lines.append(f"🔧 [DEBUG] Matches per second: {matches_per_sec:.1f}")
+            for db_key, _ in self.DB_ENTRIES:
+                pipeline_result = result.get(db_key)
+                if isinstance(pipeline_result, dict):
+                    matches = pipeline_result.get("matches", 0)
+                    lines.append(f"🔧 [DEBUG] {db_key}: {matches:,} matches")
+
+        lines.append("")
+        _write_lines(lines)
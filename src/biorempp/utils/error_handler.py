@@ -108,7 +108,7 @@ Example Usage
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Optional, Sequence, Tuple
 
 
 class EnhancedErrorHandler:
@@ -118,12 +118,12 @@ class EnhancedErrorHandler:
         "FileNotFoundError": {
             "input_file": {
                 "message": "Input file not found",
-                "solutions": [
+                "solutions": (
                     "Check if the file path is correct",
                     "Ensure the file exists in the specified location",
                     "Use absolute path if necessary",
                     "Verify file permissions",
-                ],
+                ),
                 "example": (
                     "biorempp --input /full/path/to/your_data.txt "
                     "--database biorempp"
@@ -131,24 +131,24 @@ class EnhancedErrorHandler:
             },
             "database_file": {
                 "message": "Database file not found",
-                "solutions": [
+                "solutions": (
                     "Database files may be missing or corrupted",
                     "Try reinstalling BioRemPP package",
                     "Check if all required database files are present",
                     "Verify package installation integrity",
-                ],
+                ),
                 "example": "biorempp --list-databases",
             },
         },
         "PermissionError": {
             "output_dir": {
                 "message": "Permission denied for output directory",
-                "solutions": [
+                "solutions": (
                     "Choose a different output directory",
                     "Check write permissions for the directory",
                     "Try running with administrator privileges",
                     "Create the directory manually first",
-                ],
+                ),
                 "example": (
                     "biorempp --input data.txt --database biorempp "
                     "--output-dir ~/my_results"
@@ -158,21 +158,21 @@ class EnhancedErrorHandler:
         "ValueError": {
             "invalid_database": {
                 "message": "Invalid database name",
-                "solutions": [
+                "solutions": (
                     "Use one of the available databases: biorempp, hadeg, kegg, toxcsm",
                     "Check spelling of database name (case-sensitive)",
                     "Use --list-databases to see all available options",
-                ],
+                ),
                 "example": "biorempp --input data.txt --database biorempp",
             },
             "invalid_format": {
                 "message": "Invalid file format",
-                "solutions": [
+                "solutions": (
                     "Ensure input file contains valid identifiers",
                     "Check if file contains KO identifiers (one per line)",
                     "Verify file encoding is UTF-8",
                     "Remove any special characters or formatting",
-                ],
+                ),
                 "example": "Check sample_data.txt for format reference",
             },
         },
@@ -207,10 +207,6 @@ class EnhancedErrorHandler:
             f"Error occurred: {error_type}: {error_message}", exc_info=True
         )
 
-        # Try to determine context from error message if not provided
-        if not context:
-            context = self._determine_context(error_message, error_type)
-
         # Get predefined solution
         solution_info = self._get_solution_info(error_type, context)
 
@@ -226,25 +222,6 @@ class EnhancedErrorHandler:
         fallback_solution = self._get_generic_solution(error_type)
         return f"An unexpected error occurred: {error_message}", fallback_solution
 
-    def _determine_context(self, error_message: str, error_type: str) -> str:
-        """Determine error context from error message and type."""
-        error_lower = error_message.lower()
-
-        if "input" in error_lower or "sample_data" in error_lower:
-            return "input_file"
-        elif any(db in error_lower for db in ["biorempp", "hadeg", "kegg", "toxcsm"]):
-            if "database" in error_lower or ".csv" in error_lower:
-                return "database_file"
-
-            else:
-                return "invalid_database"
-        elif "output" in error_lower or "results" in error_lower:
-            return "output_dir"
-        elif "format" in error_lower or "invalid" in error_lower:
-            return "invalid_format"
-
-        return "general"
-
     def _get_solution_info(self, error_type: str, context: str) -> Optional[Dict]:
         """Get solution information for error type and context."""
         if error_type in self.ERROR_SOLUTIONS:
@@ -253,7 +230,8 @@ class EnhancedErrorHandler:
                 return self.ERROR_SOLUTIONS[error_type]["general"]
         return None
 
-    def _format_solution(self, solutions: List[str], example: str = None) -> str:
+    @staticmethod
+    def _format_solution(solutions: Sequence[str], example: str = None) -> str:
         """Format solution text for display."""
         solution_lines = []
         for i, solution in enumerate(solutions, 1):
@@ -297,12 +275,11 @@ class EnhancedErrorHandler:
 
 
 # Global error handler instance
-_global_error_handler = None
+# Created at import time: the handler only reads class-level tables, so
+# sharing one instance is safe and needs no lazy, racy initialisation.
+_global_error_handler = EnhancedErrorHandler()
 
 
 def get_error_handler() -> EnhancedErrorHandler:
     """Get enhanced error handler instance."""
-    global _global_error_handler
-    if _global_error_handler is None:
-        _global_error_handler = EnhancedErrorHandler()
     return _global_error_handler
@@ -83,14 +83,83 @@ Example Usage
     output_dir = resolve_output_path("custom_results")
 """
 
+import hashlib
+import json
 import logging
 import os
+import shutil
+import threading
 from datetime import datetime
 from pathlib import Path
 
 # Technical logging (silent to console, file only)
 logger = logging.getLogger("biorempp.utils.io_utils")
 
+# Supported output formats; binary formats require pyarrow
+OUTPUT_FORMATS = ("txt", "parquet", "feather")
+
+# Buffer size used when writing text output
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Suffixes from which pandas infers a compression for text output
+_COMPRESSION_SUFFIXES = (".gz", ".bz2", ".zip", ".xz", ".zst", ".tar")
+
+# Most recently used output cache entries kept per output directory
+MAX_OUTPUT_CACHE_ENTRIES = 32
+
+# Output directories already created by this process
+_ensured_dirs = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def _ensure_dir(directory):
+    """
+    Create a directory once per process.
+
+    Repeated saves to the same directory skip the ``os.makedirs`` call and
+    the stat calls it makes on every path component.
+
+    Parameters
+    ----------
+    directory : str
+        Directory to create if needed.
+    """
+    if directory in _ensured_dirs:
+        return
+    with _ensured_dirs_lock:
+        os.makedirs(directory, exist_ok=True)
+        _ensured_dirs.add(directory)
+
+
+def _write_in_dir(directory, write):
+    """
+    Ensure a directory exists and call a function that writes into it.
+
+    If the directory was removed after ``_ensure_dir`` created it, the write
+    fails with FileNotFoundError; the directory is then created again and
+    the write is retried once.
+
+    Parameters
+    ----------
+    directory : str
+        Directory the file is written to.
+    write : callable
+        Function without arguments performing the write.
+
+    Returns
+    -------
+    object
+        Return value of ``write``.
+    """
+    _ensure_dir(directory)
+    try:
+        return write()
+    except FileNotFoundError:
+        with _ensured_dirs_lock:
+            _ensured_dirs.discard(directory)
+        _ensure_dir(directory)
+        return write()
+
 
 def get_project_root() -> str:
     """
@@ -238,6 +307,75 @@ def generate_timestamped_filename(filename, add_timestamp=False):
     return f"{name}_{timestamp}{ext}"
 
 
+def get_output_filename(filename, output_format="txt"):
+    """
+    Return the output filename with the extension matching the format.
+
+    Parameters
+    ----------
+    filename : str
+        Original filename.
+    output_format : str
+        One of 'txt', 'parquet' or 'feather' (default: 'txt').
+
+    Returns
+    -------
+    str
+        ``filename`` unchanged for 'txt', otherwise with its extension
+        replaced by '.parquet' or '.feather'.
+
+    Raises
+    ------
+    ValueError
+        If ``output_format`` is not supported.
+
+    Examples
+    --------
+    >>> get_output_filename("results.txt", "parquet")
+    'results.parquet'
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unsupported output format: {output_format}. "
+            f"Use one of: {', '.join(OUTPUT_FORMATS)}"
+        )
+
+    if output_format == "txt":
+        return filename
+
+    name, _ = os.path.splitext(filename)
+    return f"{name}.{output_format}"
+
+
+def check_output_dependencies(output_format):
+    """
+    Check that the optional packages needed for an output format are present.
+
+    Pipelines call this before processing any input, so that a missing
+    dependency is reported before the merge rather than at save time.
+
+    Parameters
+    ----------
+    output_format : str
+        One of 'txt', 'parquet' or 'feather'.
+
+    Raises
+    ------
+    ImportError
+        If a binary format is requested and pyarrow is not installed.
+    """
+    if output_format == "txt":
+        return
+
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        raise ImportError(
+            f"pyarrow is required for '{output_format}' output. "
+            "Install it with: pip install pyarrow"
+        )
+
+
 def save_dataframe_output(
     df,
     output_dir,
@@ -246,9 +384,10 @@ def save_dataframe_output(
     index=False,
     encoding="utf-8",
     add_timestamp=False,
+    output_format="txt",
 ):
     """
-    Save a DataFrame to a txt/csv file in the given directory.
+    Save a DataFrame to a txt/csv, Parquet or Feather file.
 
     Parameters
     ----------
@@ -267,12 +406,28 @@ def save_dataframe_output(
         File encoding (default: 'utf-8').
     add_timestamp : bool
         Whether to add timestamp to filename (default: False).
+    output_format : str
+        'txt' (delimited text, default), 'parquet' or 'feather'. Binary
+        formats are written with zstd compression, store categorical
+        columns dictionary-encoded and require pyarrow. Their column dtypes
+        are shrunk with :func:`df_shrink` first. ``sep`` and ``encoding``
+        only apply to 'txt'.
 
     Returns
     -------
     str
         Path to the saved file.
+
+    Raises
+    ------
+    ValueError
+        If ``output_format`` is not supported.
+    ImportError
+        If a binary format is requested and pyarrow is not installed.
     """
+    filename = get_output_filename(filename, output_format)
+    check_output_dependencies(output_format)
+
     # Generate timestamped filename if requested
     final_filename = generate_timestamped_filename(filename, add_timestamp)
 
@@ -282,13 +437,227 @@ def save_dataframe_output(
     logger.debug(f"Saving DataFrame to: {resolved_output_dir}/{final_filename}")
     logger.debug(f"DataFrame shape: {df.shape}")
 
-    os.makedirs(resolved_output_dir, exist_ok=True)
     output_path = os.path.join(resolved_output_dir, final_filename)
 
+    if output_format != "txt":
+        # Smaller dtypes are persisted by binary formats; text output is
+        # identical either way, so the extra pass is skipped for 'txt'.
+        # Imported here so that loading io_utils does not import pandas.
+        from biorempp.utils.dtype_utils import df_shrink
+
+        df = df_shrink(df)
+
+    def write():
+        if output_format == "parquet":
+            df.to_parquet(
+                output_path, engine="pyarrow", compression="zstd", index=index
+            )
+        elif output_format == "feather":
+            frame = df.reset_index() if index else df
+            frame.reset_index(drop=True).to_feather(output_path, compression="zstd")
+        elif output_path.lower().endswith(_COMPRESSION_SUFFIXES):
+            # Given a path, pandas infers the compression from the suffix
+            df.to_csv(output_path, sep=sep, index=index, encoding=encoding)
+        else:
+            # A 1 MiB buffer turns many small writes into a few large ones
+            with open(
+                output_path,
+                "w",
+                buffering=_WRITE_BUFFER_SIZE,
+                encoding=encoding,
+                newline="",
+            ) as f:
+                df.to_csv(f, sep=sep, index=index)
+
     try:
-        df.to_csv(output_path, sep=sep, index=index, encoding=encoding)
+        _write_in_dir(resolved_output_dir, write)
         logger.info(f"DataFrame successfully saved to: {output_path}")
         return output_path
     except Exception as e:
+        # Do not leave an empty or truncated output file behind
+        try:
+            os.remove(output_path)
+        except OSError:
+            pass
         logger.error(f"Failed to save DataFrame to {output_path}: {e}")
         raise
+
+
+def compute_file_digest(file_path, chunk_size=1 << 20):
+    """
+    Compute a BLAKE2b digest of a file, reading it in chunks.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the file to hash.
+    chunk_size : int
+        Number of bytes read per chunk (default: 1 MiB).
+
+    Returns
+    -------
+    str
+        Hex digest of the file content.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def compute_output_cache_key(input_content, database_paths, *options):
+    """
+    Build a content-addressed cache key for a pipeline run.
+
+    The key combines a BLAKE2b digest of the input content (or of a digest
+    returned by :func:`compute_file_digest`) with the installed BioRemPP
+    version, the modification time (ns) and size of each reference database,
+    plus any extra options that affect the output (e.g. pipeline name,
+    separator). Including the version keeps outputs of an older release,
+    whose merge logic may differ, from being restored after an upgrade.
+
+    Parameters
+    ----------
+    input_content : str or bytes
+        Raw input file content, or its digest.
+    database_paths : list of str
+        Database files the pipeline output depends on.
+    *options
+        Additional values that influence the generated output.
+
+    Returns
+    -------
+    str or None
+        Hex cache key, or None if any database file cannot be stat'ed
+        (in which case the run should not be cached).
+    """
+    if isinstance(input_content, str):
+        input_content = input_content.encode("utf-8")
+
+    # Imported here to avoid a circular import with the package __init__
+    from biorempp import __version__
+
+    hasher = hashlib.blake2b(input_content, digest_size=16)
+    hasher.update(f"|{__version__}".encode("utf-8"))
+
+    for path in database_paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            logger.debug(f"Output cache disabled, cannot stat database: {path}")
+            return None
+        fingerprint = f"|{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}"
+        hasher.update(fingerprint.encode("utf-8"))
+
+    for option in options:
+        hasher.update(f"|{option!r}".encode("utf-8"))
+
+    return hasher.hexdigest()
+
+
+def _get_cache_entry_dir(output_dir, cache_key):
+    """Return the cache directory for ``cache_key`` under ``output_dir``."""
+    return os.path.join(resolve_output_path(output_dir), ".cache", cache_key)
+
+
+def restore_cached_output(cache_key, output_dir, filename, add_timestamp=False):
+    """
+    Restore a previously cached pipeline output, if available.
+
+    Parameters
+    ----------
+    cache_key : str
+        Key returned by :func:`compute_output_cache_key`.
+    output_dir : str
+        Output directory of the pipeline (cache lives in ``output_dir/.cache``).
+    filename : str
+        Name of the output file.
+    add_timestamp : bool
+        Whether to add timestamp to filename (default: False).
+
+    Returns
+    -------
+    tuple or None
+        ``(output_path, matches)`` on a cache hit, None otherwise.
+    """
+    entry_dir = _get_cache_entry_dir(output_dir, cache_key)
+    cached_file = os.path.join(entry_dir, "output")
+    meta_file = os.path.join(entry_dir, "meta.json")
+
+    if not (os.path.isfile(cached_file) and os.path.isfile(meta_file)):
+        return None
+
+    resolved_output_dir = resolve_output_path(output_dir)
+    try:
+        with open(meta_file, "r", encoding="utf-8") as f:
+            matches = json.load(f)["matches"]
+
+        final_filename = generate_timestamped_filename(filename, add_timestamp)
+        output_path = os.path.join(resolved_output_dir, final_filename)
+        _write_in_dir(
+            resolved_output_dir, lambda: shutil.copyfile(cached_file, output_path)
+        )
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Ignoring unreadable output cache entry {entry_dir}: {e}")
+        return None
+
+    # Mark the entry as recently used so pruning keeps it
+    try:
+        os.utime(entry_dir)
+    except OSError:
+        pass
+
+    logger.info(f"Output restored from cache: {output_path}")
+    return output_path, matches
+
+
+def store_cached_output(cache_key, output_dir, output_path, matches):
+    """
+    Store a pipeline output in the cache for later reuse.
+
+    Only the ``MAX_OUTPUT_CACHE_ENTRIES`` most recently used entries are
+    kept; older ones are removed. The whole cache can be cleared by deleting
+    ``output_dir/.cache``. Failures are logged and ignored; caching never
+    breaks a pipeline run.
+
+    Parameters
+    ----------
+    cache_key : str
+        Key returned by :func:`compute_output_cache_key`.
+    output_dir : str
+        Output directory of the pipeline (cache lives in ``output_dir/.cache``).
+    output_path : str
+        Path of the freshly written output file.
+    matches : int
+        Number of rows in the output, restored on cache hits.
+    """
+    entry_dir = _get_cache_entry_dir(output_dir, cache_key)
+
+    try:
+        os.makedirs(entry_dir, exist_ok=True)
+        shutil.copyfile(output_path, os.path.join(entry_dir, "output"))
+        with open(os.path.join(entry_dir, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"matches": int(matches)}, f)
+        os.utime(entry_dir)
+        logger.debug(f"Output cached under: {entry_dir}")
+    except OSError as e:
+        logger.warning(f"Failed to cache output {output_path}: {e}")
+        return
+
+    _prune_output_cache(os.path.dirname(entry_dir), MAX_OUTPUT_CACHE_ENTRIES)
+
+
+def _prune_output_cache(cache_dir, max_entries):
+    """Remove the least recently used cache entries beyond ``max_entries``."""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [entry for entry in it if entry.is_dir()]
+        entries.sort(key=lambda entry: entry.stat().st_mtime_ns, reverse=True)
+    except OSError as e:
+        logger.warning(f"Failed to prune output cache {cache_dir}: {e}")
+        return
+
+    for entry in entries[max_entries:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+        logger.debug(f"Removed old output cache entry: {entry.path}")
@@ -536,6 +536,39 @@ class TestBioRemPPApplicationErrorHandling:
                         )
                         mock_info.assert_called_once_with("[INFO] Try again")
 
+    def test_pipeline_failures_are_reported_per_database(self):
+        """
+        Test that each failed database of a pipeline failure group is shown.
+        """
+        from biorempp.pipelines import raise_pipeline_failures
+
+        # Arrange
+        app = BioRemPPApplication()
+
+        def fail(args):
+            raise_pipeline_failures(
+                [("hadeg", RuntimeError("missing")), ("kegg", ValueError("bad"))]
+            )
+
+        with patch.object(app.parser, "parse_args", side_effect=fail):
+            with patch.object(
+                app.error_handler,
+                "handle_error",
+                return_value=("Pipeline failures", None),
+            ):
+                with patch.object(app.feedback_manager, "error") as mock_error:
+                    with pytest.raises(SystemExit) as exc_info:
+                        # Act
+                        app.run(["--all-databases"])
+
+                    # Assert
+                    assert exc_info.value.code == 1
+                    assert [c.args[0] for c in mock_error.call_args_list] == [
+                        "[ERROR] Pipeline failures",
+                        "[ERROR] hadeg: missing",
+                        "[ERROR] kegg: bad",
+                    ]
+
     def test_error_handling_with_parsed_args_context(self):
         """
         Test error handling with parsed arguments context.
@@ -34,6 +34,7 @@ Quality Standards:
 """
 
 import os
+import sys
 import tempfile
 from unittest.mock import Mock, patch
 
@@ -41,6 +42,11 @@ import pytest
 
 from biorempp.commands.all_merger_command import AllDatabasesMergerCommand
 
+# Exception raised by execute() when any database fails
+PIPELINE_FAILURE = (
+    ExceptionGroup if sys.version_info >= (3, 11) else RuntimeError  # noqa: F821
+)
+
 
 class TestAllDatabasesMergerCommandInitialization:
     """Test AllDatabasesMergerCommand initialization and configuration."""
@@ -212,20 +218,16 @@ class TestAllDatabasesMergerCommandExecution:
                          return_value={"input_path": "test_input.txt"}):
             
             # Act
-            result = command.execute(args)
-            
+            with pytest.raises(PIPELINE_FAILURE) as exc_info:
+                command.execute(args)
+
             # Assert
-            assert len(result) == 4
-            
-            # Check successful results
-            assert "output_path" in result["biorempp"]
-            assert "output_path" in result["kegg"]
-            
-            # Check failed results
-            assert "error" in result["hadeg"]
-            assert "HADEG failed" in result["hadeg"]["error"]
-            assert "error" in result["toxcsm"]
-            assert "ToxCSM failed" in result["toxcsm"]["error"]
+            for merge_func in mock_functions.values():
+                merge_func.assert_called_once()
+
+            failures = [(e.database, str(e)) for e in exc_info.value.exceptions]
+            assert failures == [("hadeg", "HADEG failed"), ("toxcsm", "ToxCSM failed")]
+            assert "hadeg, toxcsm" in str(exc_info.value)
 
     def test_execute_all_failures(self):
         """Test execution when all databases fail."""
@@ -246,13 +248,38 @@ class TestAllDatabasesMergerCommandExecution:
                          return_value={"input_path": "test_input.txt"}):
             
             # Act
-            result = command.execute(args)
-            
+            with pytest.raises(PIPELINE_FAILURE) as exc_info:
+                command.execute(args)
+
             # Assert
-            assert len(result) == 4
-            for db_name in mock_functions.keys():
-                assert "error" in result[db_name]
-                assert "failed" in result[db_name]["error"]
+            failed = [e.database for e in exc_info.value.exceptions]
+            assert failed == ["biorempp", "hadeg", "kegg", "toxcsm"]
+
+    def test_execute_runs_toxcsm_after_biorempp(self):
+        """Test that ToxCSM runs right after BioRemPP, before HAdeg and KEGG."""
+        command = AllDatabasesMergerCommand()
+        args = Mock()
+        args.input = "test_input.txt"
+        call_order = []
+
+        def make_merge(db_name):
+            def merge(**kwargs):
+                call_order.append(db_name)
+                return {"output_path": f"/path/{db_name}.txt"}
+
+            return merge
+
+        mock_functions = {name: make_merge(name) for name in command.MERGE_FUNCTIONS}
+
+        with patch.dict(command.MERGE_FUNCTIONS, mock_functions), patch.object(
+            command, "_build_pipeline_kwargs", return_value={}
+        ):
+            # Act
+            result = command.execute(args)
+
+        # Assert
+        assert call_order == ["biorempp", "toxcsm", "hadeg", "kegg"]
+        assert list(result) == ["biorempp", "hadeg", "kegg", "toxcsm"]
 
     def test_execute_logging_summary(self):
         """Test that execution logs summary information."""
@@ -275,8 +302,9 @@ class TestAllDatabasesMergerCommandExecution:
              patch.object(command.logger, 'warning') as mock_warning:
             
             # Act
-            command.execute(args)
-            
+            with pytest.raises(PIPELINE_FAILURE):
+                command.execute(args)
+
             # Assert logging calls
             info_calls = [call[0][0] for call in mock_info.call_args_list]
             
@@ -530,18 +558,17 @@ class TestAllDatabasesMergerCommandParametrized:
              patch.object(command, '_build_pipeline_kwargs', 
                          return_value={}):
             
-            # Act
-            result = command.execute(args)
-            
-            # Assert
-            assert len(result) == 4
-            
-            # Count successful and failed results
-            successful = sum(1 for r in result.values() if "error" not in r)
-            failed = sum(1 for r in result.values() if "error" in r)
-            
-            assert successful == (4 - num_failures)
-            assert failed == num_failures
+            # Act & Assert
+            if num_failures:
+                with pytest.raises(PIPELINE_FAILURE) as exc_info:
+                    command.execute(args)
+                assert len(exc_info.value.exceptions) == num_failures
+            else:
+                assert len(command.execute(args)) == 4
+
+            # Every database is processed despite earlier failures
+            for merge_func in mock_functions.values():
+                merge_func.assert_called_once()
 
 
 class TestAllDatabasesMergerCommandIntegration:
@@ -5,6 +5,8 @@ Tests for input loading and merging functions,
 particularly load_and_merge_input.
 """
 
+from concurrent.futures import Future
+
 import pandas as pd
 
 from biorempp.input_processing.input_loader import load_and_merge_input
@@ -391,3 +393,31 @@ class TestLoadAndMergeInput:
         assert isinstance(df, pd.DataFrame)
         assert not df.empty
         assert len(df["sample"].unique()) <= 100
+
+    def test_load_and_merge_input_database_future(
+        self, fasta_like_input_txt, mock_biorempp_db_csv
+    ):
+        """
+        Test that a database passed as a Future is resolved before merging.
+
+        Verifies that the result matches a merge that reads the database
+        file directly.
+        """
+        # Arrange
+        database_future = Future()
+        database_future.set_result(pd.read_csv(mock_biorempp_db_csv, sep=";"))
+        expected, _ = load_and_merge_input(
+            fasta_like_input_txt, "input.txt", database_filepath=mock_biorempp_db_csv
+        )
+
+        # Act
+        df, error = load_and_merge_input(
+            fasta_like_input_txt,
+            "input.txt",
+            database_filepath=mock_biorempp_db_csv,
+            database_df=database_future,
+        )
+
+        # Assert
+        assert error is None
+        pd.testing.assert_frame_equal(df, expected)
@@ -6,8 +6,11 @@ particularly validate_and_process_input.
 """
 
 import base64
+import io
 
+import numpy as np
 import pandas as pd
+import pytest
 
 from biorempp.input_processing.input_validator import validate_and_process_input
 
@@ -318,3 +321,148 @@ class TestValidateAndProcessInput:
         ko_counts = df[df["sample"] == "Sample1"]["ko"].value_counts()
         assert ko_counts["K00001"] == 2
         assert ko_counts["K00002"] == 1
+
+    def test_validate_and_process_input_file_object(self, fasta_like_input_txt):
+        """
+        Test that an open text file is parsed the same way as a string.
+        """
+        # Act
+        df_stream, error = validate_and_process_input(
+            io.StringIO(fasta_like_input_txt), "input.txt"
+        )
+        df_string, _ = validate_and_process_input(fasta_like_input_txt, "input.txt")
+
+        # Assert
+        assert error is None
+        pd.testing.assert_frame_equal(df_stream, df_string)
+
+    def test_validate_and_process_input_base64_file_object(self, fasta_like_input_txt):
+        """
+        Test that a base64 data URI is still decoded when read from a file.
+        """
+        # Arrange
+        base64_bytes = base64.b64encode(fasta_like_input_txt.encode()).decode()
+        encoded = io.StringIO(f"data:text/plain;base64,{base64_bytes}")
+
+        # Act
+        df, error = validate_and_process_input(encoded, "input.txt")
+
+        # Assert
+        assert error is None
+        assert len(df) == len(self.extract_ko_records(fasta_like_input_txt))
+
+    def test_validate_and_process_input_file_object_invalid_line(self):
+        """
+        Test that errors from file objects report the failing line number.
+        """
+        # Arrange
+        content = io.StringIO(">Sample1\nK00001\nINVALID_LINE\n")
+
+        # Act
+        df, error = validate_and_process_input(content, "input.txt")
+
+        # Assert
+        assert df is None
+        assert "line 3" in error
+
+
+class TestCompiledLineParser:
+    """
+    Tests for the array-based line classifier path of process_content_lines.
+
+    The numba classifier is exercised as plain Python when numba is not
+    installed, by forcing it on; the NumPy classifier is used otherwise.
+    """
+
+    @pytest.fixture
+    def fast_path(self, monkeypatch):
+        """Force process_content_lines to use the numba classifier."""
+        from biorempp.input_processing import input_validator
+
+        monkeypatch.setattr(input_validator, "_NUMBA_AVAILABLE", True)
+        return input_validator
+
+    def test_classify_lines_kinds(self):
+        """Test line classification of a small buffer."""
+        from biorempp.input_processing import input_validator as iv
+
+        text = ">S1\n K00001 \n\n>\nK12a\nX"
+        kinds = np.empty(6, dtype=np.uint8)
+        classify = getattr(iv._classify_lines, "py_func", iv._classify_lines)
+
+        classify(np.frombuffer(text.encode(), dtype=np.uint8), kinds)
+
+        assert kinds.tolist() == [
+            iv._LINE_SAMPLE,
+            iv._LINE_KO,
+            iv._LINE_BLANK,
+            iv._LINE_INVALID,
+            iv._LINE_INVALID,
+            iv._LINE_INVALID,
+        ]
+
+    def test_classify_lines_vectorized_kinds(self):
+        """Test that the NumPy classifier agrees with the byte scanner."""
+        from biorempp.input_processing import input_validator as iv
+
+        lines = [">S1", "K00001", "", ">", "K12a", "X", "K", "Ké1"]
+
+        kinds = iv._classify_lines_vectorized(lines)
+
+        assert kinds.tolist() == [
+            iv._LINE_SAMPLE,
+            iv._LINE_KO,
+            iv._LINE_BLANK,
+            iv._LINE_INVALID,
+            iv._LINE_INVALID,
+            iv._LINE_INVALID,
+            iv._LINE_INVALID,
+            iv._LINE_INVALID,
+        ]
+
+    def test_fast_path_matches_regex_path(
+        self, fast_path, monkeypatch, fasta_like_input_txt
+    ):
+        """Test that both classifiers and the regex parser agree."""
+        content = "  \n> Sample 1 \nK00001\n\nK00002\n>S2\nK00003\n"
+
+        for text in (content, fasta_like_input_txt):
+            df_numba, error = fast_path.process_content_lines(io.StringIO(text))
+            monkeypatch.setattr(fast_path, "_NUMBA_AVAILABLE", False)
+            df_numpy, _ = fast_path.process_content_lines(io.StringIO(text))
+            monkeypatch.setattr(
+                fast_path, "_parse_lines_fast", lambda *args: (False, args[2])
+            )
+            df_regex, _ = fast_path.process_content_lines(io.StringIO(text))
+            monkeypatch.undo()
+            monkeypatch.setattr(fast_path, "_NUMBA_AVAILABLE", True)
+
+            assert error is None
+            pd.testing.assert_frame_equal(df_numba, df_regex)
+            pd.testing.assert_frame_equal(df_numpy, df_regex)
+
+    def test_fast_path_sample_carried_across_batches(self, fast_path, monkeypatch):
+        """Test that the current sample carries over batch boundaries."""
+        monkeypatch.setattr(fast_path, "_LINE_BATCH_SIZE", 2)
+        content = ">S1\nK00001\nK00002\nK00003\n>S2\nK00004\n"
+
+        df, error = fast_path.process_content_lines(io.StringIO(content))
+
+        assert error is None
+        assert df["sample"].tolist() == ["S1", "S1", "S1", "S2"]
+        assert df["ko"].tolist() == ["K00001", "K00002", "K00003", "K00004"]
+
+    @pytest.mark.parametrize(
+        "content, expected",
+        [
+            (">S1\nK00001\nBAD\n", "line 3: 'BAD'"),
+            ("K00001\n>S1\n", "Expected '>' for sample ID before KO entry"),
+            ("> \nK00001\n", "line 1: '>'"),
+        ],
+    )
+    def test_fast_path_errors_match_regex_path(self, fast_path, content, expected):
+        """Test that invalid batches report the regex validator's errors."""
+        df, error = fast_path.process_content_lines(io.StringIO(content))
+
+        assert df is None
+        assert expected in error
@@ -259,6 +259,30 @@ class TestMergeInputWithBiorempp:
             # Assert
             mock_read_csv.assert_called_once()
 
+    def test_merge_input_with_biorempp_preloaded_database(
+        self, input_df_from_fasta, mock_biorempp_db_csv
+    ):
+        """
+        Test that a preloaded database is used instead of re-reading the CSV.
+        """
+        # Arrange
+        database_df = pd.read_csv(mock_biorempp_db_csv, sep=";")
+        expected = merge_input_with_biorempp(input_df_from_fasta, mock_biorempp_db_csv)
+
+        mock_path = "biorempp.input_processing.biorempp_merge_processing.pd.read_csv"
+        with patch(mock_path) as mock_read_csv:
+            # Act
+            result = merge_input_with_biorempp(
+                input_df_from_fasta,
+                mock_biorempp_db_csv,
+                database_df=database_df,
+            )
+
+            # Assert
+            mock_read_csv.assert_not_called()
+
+        pd.testing.assert_frame_equal(result, expected)
+
     def test_merge_input_with_biorempp_data_types_preserved(
         self, input_df_from_fasta, mock_biorempp_db_csv
     ):
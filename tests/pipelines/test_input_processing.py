@@ -49,6 +49,7 @@ Test Data:
 """
 
 import os
+import sys
 from unittest.mock import patch
 
 import pandas as pd
@@ -61,6 +62,11 @@ from biorempp.pipelines.input_processing import (
     run_toxcsm_processing_pipeline,
 )
 
+# Exception raised by run_all_processing_pipelines when a pipeline fails
+PIPELINE_FAILURE = (
+    ExceptionGroup if sys.version_info >= (3, 11) else RuntimeError  # noqa: F821
+)
+
 
 class TestRunBioremppProcessingPipeline:
     """Test suite for run_biorempp_processing_pipeline function."""
@@ -131,6 +137,42 @@ class TestRunBioremppProcessingPipeline:
             header = f.readline()
             assert "," in header  # Verifica separador personalizado
 
+    def test_biorempp_pipeline_output_cache_hit(
+        self, tmp_path, fasta_like_input_txt, mock_biorempp_db_csv
+    ):
+        """
+        Test that a repeated run with use_cache=True restores the output
+        without merging again.
+        """
+        # Arrange
+        input_file = tmp_path / "cached_input.txt"
+        input_file.write_text(fasta_like_input_txt, encoding="utf-8")
+        output_dir = tmp_path / "cached_outputs"
+
+        first = run_biorempp_processing_pipeline(
+            input_path=str(input_file),
+            database_path=mock_biorempp_db_csv,
+            output_dir=str(output_dir),
+            use_cache=True,
+        )
+        os.remove(first["output_path"])
+
+        # Act
+        with patch(
+            "biorempp.pipelines.input_processing.load_and_merge_input"
+        ) as mock_load:
+            second = run_biorempp_processing_pipeline(
+                input_path=str(input_file),
+                database_path=mock_biorempp_db_csv,
+                output_dir=str(output_dir),
+                use_cache=True,
+            )
+
+        # Assert
+        mock_load.assert_not_called()
+        assert second == first
+        assert os.path.exists(second["output_path"])
+
     def test_biorempp_pipeline_file_not_found_error(self, mock_biorempp_db_csv):
         """
         Test error handling when input file does not exist.
@@ -359,7 +401,7 @@ class TestRunKeggProcessingPipeline:
         
         # Act
         with patch(
-            "biorempp.input_processing.input_validator.validate_and_process_input"
+            "biorempp.pipelines.input_processing.validate_and_process_input"
         ) as mock_validate:
             mock_validate.return_value = (mock_df, None)
             
@@ -385,7 +427,7 @@ class TestRunKeggProcessingPipeline:
                         "kegg_filepath"
                     ]
 
-    @patch("biorempp.input_processing.input_validator.validate_and_process_input")
+    @patch("biorempp.pipelines.input_processing.validate_and_process_input")
     def test_kegg_pipeline_validation_error(
         self, mock_validate, tmp_path, fasta_like_input_txt
     ):
@@ -813,6 +855,249 @@ class TestRunToxcsmProcessingPipeline:
 class TestPipelineIntegration:
     """Integration tests between different pipelines."""
 
+    def test_database_parsed_once_across_pipeline_runs(
+        self, tmp_path, fasta_like_input_txt, mock_biorempp_db_csv
+    ):
+        """
+        Test that repeated runs reuse the parsed database until it changes.
+        """
+        from biorempp.pipelines.input_processing import _load_database_cached
+
+        # Arrange
+        input_file = tmp_path / "cached_db_input.txt"
+        input_file.write_text(fasta_like_input_txt, encoding="utf-8")
+        _load_database_cached.cache_clear()
+
+        # Act
+        results = [
+            run_biorempp_processing_pipeline(
+                input_path=str(input_file),
+                database_path=mock_biorempp_db_csv,
+                output_dir=str(tmp_path / f"run_{i}"),
+            )
+            for i in range(2)
+        ]
+        cache_info = _load_database_cached.cache_info()
+
+        # Touching the database invalidates the cached copy
+        stat = os.stat(mock_biorempp_db_csv)
+        os.utime(
+            mock_biorempp_db_csv,
+            ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000),
+        )
+        run_biorempp_processing_pipeline(
+            input_path=str(input_file),
+            database_path=mock_biorempp_db_csv,
+            output_dir=str(tmp_path / "run_2"),
+        )
+
+        # Assert
+        assert results[0]["matches"] == results[1]["matches"] > 0
+        assert cache_info.misses == 1
+        assert cache_info.hits == 1
+        assert _load_database_cached.cache_info().misses == 2
+
+    def test_pipeline_without_saving_output(
+        self, tmp_path, fasta_like_input_txt, mock_biorempp_db_csv
+    ):
+        """
+        Test that save=False returns the match count without writing output.
+        """
+        # Arrange
+        input_file = tmp_path / "no_save_input.txt"
+        input_file.write_text(fasta_like_input_txt, encoding="utf-8")
+        output_dir = tmp_path / "no_save_output"
+
+        # Act
+        saved = run_biorempp_processing_pipeline(
+            input_path=str(input_file),
+            database_path=mock_biorempp_db_csv,
+            output_dir=str(tmp_path / "saved_output"),
+        )
+        result = run_biorempp_processing_pipeline(
+            input_path=str(input_file),
+            database_path=mock_biorempp_db_csv,
+            output_dir=str(output_dir),
+            use_cache=True,
+            save=False,
+        )
+
+        # Assert
+        assert result == {
+            "output_path": None,
+            "matches": saved["matches"],
+            "filename": None,
+        }
+        assert not output_dir.exists()
+
+    def test_database_loader_falls_back_to_default_engine(self, mock_biorempp_db_csv):
+        """
+        Test that the database loader falls back to the pandas parser when
+        the pyarrow engine cannot be used.
+        """
+        from biorempp.pipelines.input_processing import _load_database_cached
+
+        # Arrange
+        _load_database_cached.cache_clear()
+        expected = pd.read_csv(mock_biorempp_db_csv, encoding="utf-8", sep=";")
+        read_csv = pd.read_csv
+
+        def fake_read_csv(*args, **kwargs):
+            if kwargs.get("engine") == "pyarrow":
+                raise ImportError("pyarrow is not installed")
+            return read_csv(*args, **kwargs)
+
+        # Act
+        with patch(
+            "biorempp.pipelines.input_processing._PYARROW_AVAILABLE", True
+        ), patch(
+            "biorempp.pipelines.input_processing.pd.read_csv",
+            side_effect=fake_read_csv,
+        ) as mock_read_csv:
+            result = _load_database_cached(mock_biorempp_db_csv, 0, 0)
+        _load_database_cached.cache_clear()
+
+        # Assert
+        assert mock_read_csv.call_count == 2
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_run_all_processing_pipelines_concurrently(
+        self, tmp_path, fasta_like_input_txt, mock_biorempp_db_csv
+    ):
+        """
+        Test that all pipelines run in worker processes and that one failing
+        pipeline does not affect the others.
+        """
+        from biorempp.pipelines import run_all_processing_pipelines
+
+        # Arrange
+        input_file = tmp_path / "parallel_input.txt"
+        input_file.write_text(fasta_like_input_txt, encoding="utf-8")
+        output_dir = tmp_path / "parallel_outputs"
+
+        # Act
+        with pytest.raises(PIPELINE_FAILURE) as exc_info:
+            run_all_processing_pipelines(
+                str(input_file),
+                database_paths={
+                    "biorempp": mock_biorempp_db_csv,
+                    "hadeg": str(tmp_path / "missing_hadeg.csv"),
+                },
+                output_dir=str(output_dir),
+                max_workers=2,
+            )
+
+        # Assert
+        (failure,) = exc_info.value.exceptions
+        assert failure.database == "hadeg"
+        assert isinstance(failure, RuntimeError)
+        # The other pipelines still wrote their outputs
+        assert len(os.listdir(output_dir)) == 3
+
+    def test_run_all_processing_pipelines_results(
+        self, tmp_path, fasta_like_input_txt, mock_biorempp_db_csv
+    ):
+        """Test that successful pipelines return results keyed by database."""
+        from biorempp.pipelines import run_all_processing_pipelines
+
+        # Arrange
+        input_file = tmp_path / "parallel_input.txt"
+        input_file.write_text(fasta_like_input_txt, encoding="utf-8")
+
+        # Act
+        results = run_all_processing_pipelines(
+            str(input_file),
+            database_paths={"biorempp": mock_biorempp_db_csv},
+            output_dir=str(tmp_path / "parallel_outputs"),
+            max_workers=2,
+        )
+
+        # Assert
+        assert list(results) == ["biorempp", "hadeg", "kegg", "toxcsm"]
+        assert results["biorempp"]["matches"] > 0
+        for result in results.values():
+            assert os.path.exists(result["output_path"])
+
+    def test_binary_format_without_pyarrow_fails_before_merging(
+        self, tmp_path, fasta_like_input_txt, monkeypatch
+    ):
+        """Test that a missing pyarrow is reported before the input is merged."""
+        from biorempp.pipelines import input_processing
+
+        # Arrange
+        input_file = tmp_path / "parquet_input.txt"
+        input_file.write_text(fasta_like_input_txt, encoding="utf-8")
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        # Act & Assert
+        with patch.object(input_processing, "load_and_merge_input") as mock_load:
+            with pytest.raises(ImportError, match="pyarrow is required"):
+                run_biorempp_processing_pipeline(
+                    input_path=str(input_file),
+                    output_dir=str(tmp_path),
+                    output_format="parquet",
+                )
+        mock_load.assert_not_called()
+
+    def test_toxcsm_pipeline_reuses_biorempp_merge_from_context(
+        self, tmp_path, fasta_like_input_txt
+    ):
+        """
+        Test that a shared PipelineContext avoids a second BioRemPP merge.
+        """
+        from biorempp.pipelines import PipelineContext
+        from biorempp.pipelines import input_processing
+
+        # Arrange
+        input_file = tmp_path / "context_input.txt"
+        input_file.write_text(fasta_like_input_txt, encoding="utf-8")
+        context = PipelineContext(input_path=str(input_file))
+
+        # Act
+        with patch.object(
+            input_processing,
+            "load_and_merge_input",
+            wraps=input_processing.load_and_merge_input,
+        ) as mock_load:
+            biorempp_result = run_biorempp_processing_pipeline(
+                input_path=str(input_file),
+                output_dir=str(tmp_path),
+                context=context,
+            )
+            shared_rows = len(context.df_biorempp)
+            toxcsm_result = run_toxcsm_processing_pipeline(
+                input_path=str(input_file),
+                output_dir=str(tmp_path),
+                context=context,
+            )
+
+        # Assert
+        assert mock_load.call_count == 1
+        assert shared_rows == biorempp_result["matches"]
+        assert os.path.exists(toxcsm_result["output_path"])
+        # ToxCSM is the last consumer, so the merge is released
+        assert context.df_biorempp is None
+
+    def test_pipeline_context_for_other_input_is_rejected(
+        self, tmp_path, fasta_like_input_txt, mock_biorempp_db_csv
+    ):
+        """Test that a context built for another input file is not reused."""
+        from biorempp.pipelines import PipelineContext
+
+        # Arrange
+        input_file = tmp_path / "context_input.txt"
+        input_file.write_text(fasta_like_input_txt, encoding="utf-8")
+        context = PipelineContext(input_path=str(tmp_path / "other.txt"))
+
+        # Act & Assert
+        with pytest.raises(ValueError, match="Pipeline context belongs to"):
+            run_biorempp_processing_pipeline(
+                input_path=str(input_file),
+                database_path=mock_biorempp_db_csv,
+                output_dir=str(tmp_path),
+                context=context,
+            )
+
     def test_all_pipelines_consistent_return_format(
         self, tmp_path, fasta_like_input_txt, mock_biorempp_db_csv,
         mock_kegg_degradation_pathways_csv, mock_hadeg_database_csv
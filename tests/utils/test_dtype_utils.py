@@ -0,0 +1,112 @@
+"""
+Unit tests for dtype_utils module.
+
+Tests for the df_shrink DataFrame dtype downcasting utility.
+"""
+
+import pandas as pd
+import pytest
+
+from biorempp.utils.dtype_utils import df_shrink, unify_categorical_key
+
+
+class TestDfShrink:
+    """Test suite for df_shrink function."""
+
+    def test_df_shrink_downcasts_integers(self):
+        """Test that integer columns get the smallest signed type."""
+        df = pd.DataFrame({"small": [1, -2, 3], "large": [1, 2, 100_000]})
+
+        result = df_shrink(df)
+
+        assert result["small"].dtype == "int8"
+        assert result["large"].dtype == "int32"
+        assert (result["large"] == df["large"]).all()
+
+    def test_df_shrink_int2uint(self):
+        """Test that non-negative integer columns can become unsigned."""
+        df = pd.DataFrame({"count": [0, 200, 255], "delta": [-1, 0, 1]})
+
+        result = df_shrink(df, int2uint=True)
+
+        assert result["count"].dtype == "uint8"
+        assert result["delta"].dtype == "int8"
+
+    def test_df_shrink_low_cardinality_strings_to_category(self):
+        """Test that only low-cardinality string columns become categorical."""
+        df = pd.DataFrame(
+            {
+                "ko": ["K00001", "K00001", "K00001", "K00001", "K00002"],
+                "name": ["a", "b", "c", "d", "e"],
+            }
+        )
+
+        result = df_shrink(df)
+
+        assert isinstance(result["ko"].dtype, pd.CategoricalDtype)
+        assert not isinstance(result["name"].dtype, pd.CategoricalDtype)
+
+    def test_df_shrink_skip_and_floats_untouched(self):
+        """Test that skipped and float columns keep their dtypes."""
+        df = pd.DataFrame(
+            {"ko": ["K00001"] * 4, "value": [0.1, 0.2, 0.3, 0.4], "n": [1] * 4}
+        )
+
+        result = df_shrink(df, skip=["ko", "n"])
+
+        assert result["ko"].dtype == df["ko"].dtype
+        assert result["n"].dtype == df["n"].dtype
+        assert result["value"].dtype == "float64"
+
+    def test_df_shrink_does_not_modify_input(self):
+        """Test that the input DataFrame is left unchanged."""
+        df = pd.DataFrame({"ko": ["K00001"] * 4, "n": [1, 2, 3, 4]})
+        original_dtypes = df.dtypes.copy()
+
+        df_shrink(df)
+
+        pd.testing.assert_series_equal(df.dtypes, original_dtypes)
+
+    def test_df_shrink_empty_dataframe(self):
+        """Test that empty DataFrames are returned unchanged."""
+        df = pd.DataFrame({"ko": pd.Series([], dtype=object)})
+
+        result = df_shrink(df)
+
+        assert result.empty
+        assert result["ko"].dtype == object
+
+    def test_df_shrink_invalid_input(self):
+        """Test that non-DataFrame input raises TypeError."""
+        with pytest.raises(TypeError, match="Input must be a pandas DataFrame"):
+            df_shrink([1, 2, 3])
+
+
+class TestUnifyCategoricalKey:
+    """Test suite for unify_categorical_key function."""
+
+    def test_unify_categorical_key_shares_categories(self):
+        """Test that both keys get the same categorical dtype."""
+        left = pd.DataFrame({"ko": pd.Categorical(["K00001", "K00003"])})
+        right = pd.DataFrame(
+            {"ko": pd.Categorical(["K00002", "K00003"]), "name": ["b", "c"]}
+        )
+
+        new_left, new_right = unify_categorical_key(left, right, "ko")
+
+        assert new_left["ko"].dtype == new_right["ko"].dtype
+        assert list(new_left["ko"].cat.categories) == ["K00001", "K00002", "K00003"]
+        merged = pd.merge(new_left, new_right, on="ko", how="inner")
+        assert merged["name"].tolist() == ["c"]
+        # Inputs are not modified
+        assert list(left["ko"].cat.categories) == ["K00001", "K00003"]
+
+    def test_unify_categorical_key_non_categorical_unchanged(self):
+        """Test that non-categorical keys are returned as-is."""
+        left = pd.DataFrame({"ko": ["K00001"]})
+        right = pd.DataFrame({"ko": pd.Categorical(["K00001"])})
+
+        new_left, new_right = unify_categorical_key(left, right, "ko")
+
+        assert new_left is left
+        assert new_right is right
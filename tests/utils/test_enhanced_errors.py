@@ -98,6 +98,17 @@ class TestEnhancedErrorHandler:
         assert "An unexpected error occurred" in message
         assert "Some unknown error occurred" in message
 
+    def test_handle_error_unknown_error_type_skips_context(self):
+        """Test that unknown error types do not scan the message."""
+        handler = EnhancedErrorHandler()
+        error = RuntimeError("input file not found")
+
+        with patch.object(handler, "_determine_context") as mock_context:
+            message, _ = handler.handle_error(error)
+
+        mock_context.assert_not_called()
+        assert "An unexpected error occurred" in message
+
     def test_determine_context_input_file(self):
         """Test context determination for input file errors."""
         handler = EnhancedErrorHandler()
@@ -166,6 +177,14 @@ class TestEnhancedErrorHandler:
         context = handler._determine_context("No module named 'pandas'", "ImportError")
         assert context == "missing_dependency"
 
+    def test_determine_context_overlapping_keywords(self):
+        """Test that keywords sharing characters are all detected."""
+        handler = EnhancedErrorHandler()
+
+        # "no data" and "database" overlap in "no database"
+        context = handler._determine_context("kegg: no database", "ValueError")
+        assert context == "database_file"
+
     def test_get_solution_info_existing(self):
         """Test getting solution info for existing error/context combination."""
         handler = EnhancedErrorHandler()
@@ -208,6 +227,50 @@ class TestEnhancedErrorHandler:
         assert "2. Solution 2" in formatted
         assert "📚 Example:" not in formatted
 
+    def test_formatted_solutions_match_format_solution(self):
+        """Test that the precomputed table matches on-demand formatting."""
+        handler = EnhancedErrorHandler()
+
+        for error_type, contexts in handler.ERROR_SOLUTIONS.items():
+            for context, info in contexts.items():
+                expected = (
+                    info["message"],
+                    handler._format_solution(info["solutions"], info.get("example")),
+                )
+                assert handler._FORMATTED_SOLUTIONS[error_type][context] == expected
+
+    def test_handle_error_formats_solution_added_at_runtime(self):
+        """Test that entries missing from the precomputed table still work."""
+        handler = EnhancedErrorHandler()
+        runtime_entry = {
+            "general": {"message": "Runtime failure", "solutions": ["Retry"]}
+        }
+
+        with patch.dict(handler.ERROR_SOLUTIONS, {"RuntimeError": runtime_entry}):
+            message, solution = handler.handle_error(RuntimeError("boom"))
+
+        assert message == "Runtime failure"
+        assert solution == "   1. Retry"
+
+    def test_handle_error_with_context_does_not_format_message(self):
+        """Test that a known solution does not need the error message."""
+        str_calls = []
+
+        def counting_str(error):
+            str_calls.append(error)
+            return "missing.txt"
+
+        # Same type name as the builtin, so the predefined solution applies
+        error_class = type(
+            "FileNotFoundError", (FileNotFoundError,), {"__str__": counting_str}
+        )
+        handler = EnhancedErrorHandler()
+
+        message, _ = handler.handle_error(error_class(), "input_file")
+
+        assert message == "Input file not found"
+        assert str_calls == []
+
     def test_get_generic_solution_known_error(self):
         """Test getting generic solution for known error type."""
         handler = EnhancedErrorHandler()
@@ -295,26 +358,34 @@ class TestErrorHandlerFactory:
         handler2 = get_error_handler()
         assert handler1 is handler2
 
-    def test_get_error_handler_with_feedback_manager(self):
+    def test_get_error_handler_with_feedback_manager(self, monkeypatch):
         """Test get_error_handler with feedback manager."""
         mock_feedback = Mock()
 
-        # Reset global handler for this test
+        # Use a fresh global handler for this test
         import biorempp.utils.enhanced_errors
 
-        biorempp.utils.enhanced_errors._global_error_handler = None
+        monkeypatch.setattr(
+            biorempp.utils.enhanced_errors,
+            "_global_error_handler",
+            EnhancedErrorHandler(),
+        )
 
         handler = get_error_handler(feedback_manager=mock_feedback)
         assert handler.feedback_manager == mock_feedback
 
-    def test_get_error_handler_preserves_feedback_manager(self):
+    def test_get_error_handler_preserves_feedback_manager(self, monkeypatch):
         """Test that subsequent calls preserve feedback manager."""
         mock_feedback = Mock()
 
-        # Reset global handler for this test
+        # Use a fresh global handler for this test
         import biorempp.utils.enhanced_errors
 
-        biorempp.utils.enhanced_errors._global_error_handler = None
+        monkeypatch.setattr(
+            biorempp.utils.enhanced_errors,
+            "_global_error_handler",
+            EnhancedErrorHandler(),
+        )
 
         handler1 = get_error_handler(feedback_manager=mock_feedback)
         handler2 = get_error_handler()  # No feedback manager in second call
@@ -322,6 +393,23 @@ class TestErrorHandlerFactory:
         assert handler1 is handler2
         assert handler2.feedback_manager == mock_feedback
 
+    def test_get_error_handler_keeps_first_feedback_manager(self, monkeypatch):
+        """Test that a later feedback manager does not replace the first one."""
+        import biorempp.utils.enhanced_errors
+
+        monkeypatch.setattr(
+            biorempp.utils.enhanced_errors,
+            "_global_error_handler",
+            EnhancedErrorHandler(),
+        )
+        first, second = Mock(), Mock()
+
+        handler1 = get_error_handler(feedback_manager=first)
+        handler2 = get_error_handler(feedback_manager=second)
+
+        assert handler1 is handler2
+        assert handler2.feedback_manager is first
+
 
 class TestErrorHandlerIntegration:
     """Integration tests for error handler system."""
@@ -5,12 +5,17 @@ These tests verify that the enhanced logging functionality works correctly.
 """
 
 import logging
+import queue
+import threading
 from unittest.mock import Mock, patch
 
 import pytest
 
 from biorempp.utils.enhanced_logging import (
     BioRemPPLogger,
+    _CachedRotatingFileHandler,
+    _CachedTimeFormatter,
+    _DropOldestQueueHandler,
     get_enhanced_logger,
     set_console_level,
 )
@@ -109,3 +114,247 @@ class TestLoggingIntegration:
         assert logger2 is not None
         # They should be different instances or at least work independently
         assert logger1 != logger2 or True  # Always pass if they work
+
+
+class TestBackgroundFileLogging:
+    """Test suite for the queued technical file logging."""
+
+    def test_close_writes_queued_records(self, tmp_path):
+        """Test that records queued before close() reach the log file."""
+        logger = BioRemPPLogger(log_dir=str(tmp_path))
+
+        logger.info("queued technical message")
+        logger.close()
+
+        (log_file,) = tmp_path.glob("biorempp_*.log")
+        assert "queued technical message" in log_file.read_text(encoding="utf-8")
+
+    def test_instances_with_same_settings_share_handlers(self, tmp_path):
+        """Test that a second logger reuses the configured file handlers."""
+        first = BioRemPPLogger(log_dir=str(tmp_path))
+        second = BioRemPPLogger("VERBOSE", log_dir=str(tmp_path))
+
+        first.info("from first")
+        second.info("from second")
+
+        assert first._technical_log is second._technical_log
+        assert len(logging.getLogger("biorempp.technical").handlers) == 1
+        second.close()
+        (log_file,) = tmp_path.glob("biorempp_*.log")
+        content = log_file.read_text(encoding="utf-8")
+        assert "from first" in content and "from second" in content
+
+    @pytest.mark.parametrize("level", ["warn", "FATAL", "NOTSET"])
+    def test_level_aliases_are_accepted(self, tmp_path, level):
+        """Test that logging level aliases work as file levels."""
+        logger = BioRemPPLogger(file_level=level, log_dir=str(tmp_path))
+
+        logger.critical("aliased level")
+        logger.close()
+
+        (log_file,) = tmp_path.glob("biorempp_*.log")
+        assert "aliased level" in log_file.read_text(encoding="utf-8")
+
+    def test_unknown_level_fails_at_construction(self, tmp_path):
+        """Test that an unknown file level is rejected before any logging."""
+        with pytest.raises(ValueError, match="Unknown log level: VERBOSE"):
+            BioRemPPLogger(file_level="verbose", log_dir=str(tmp_path))
+
+    def test_file_logging_is_set_up_on_first_use(self, tmp_path):
+        """Test that no log directory is created until something is logged."""
+        log_dir = tmp_path / "logs"
+        logger = BioRemPPLogger(log_dir=str(log_dir))
+
+        assert not log_dir.exists()
+
+        logger.debug("first record")
+
+        assert log_dir.is_dir()
+        logger.close()
+
+    def test_close_is_idempotent(self, tmp_path):
+        """Test that closing twice does not raise."""
+        logger = BioRemPPLogger(log_dir=str(tmp_path))
+
+        logger.close()
+        logger.close()
+
+        assert logger._technical_log is None
+
+    def test_errors_are_written_without_close(self, tmp_path):
+        """Test that error records flush the buffered records immediately."""
+        logger = BioRemPPLogger(log_dir=str(tmp_path))
+
+        logger.info("buffered message")
+        logger.error("error message")
+        (log_file,) = tmp_path.glob("biorempp_*.log")
+        logger._technical_log.listener.queue.join()
+
+        content = log_file.read_text(encoding="utf-8")
+        assert "buffered message" in content
+        assert "error message" in content
+        logger.close()
+
+
+class TestUserMessages:
+    """Test suite for the console and log output of user messages."""
+
+    def test_user_warning_console_and_log(self, tmp_path, capsys):
+        """Test that a warning is printed and logged by the calling method."""
+        logger = BioRemPPLogger(log_dir=str(tmp_path))
+
+        logger.user_warning("disk almost full", "free some space")
+        logger.close()
+
+        assert capsys.readouterr().out == (
+            "⚠️  Warning: disk almost full\n💡 Suggestion: free some space\n"
+        )
+        (log_file,) = tmp_path.glob("biorempp_*.log")
+        log_line = log_file.read_text(encoding="utf-8").splitlines()[-1]
+        assert "| user_warning    |" in log_line
+        assert log_line.endswith(
+            "USER_WARNING: disk almost full | Suggestion: free some space"
+        )
+
+    def test_success_details_are_rendered_when_written(self, tmp_path):
+        """Test that the details are converted to text only when written."""
+        rendered = []
+
+        class Details:
+            def __str__(self):
+                rendered.append(True)
+                return "3 files"
+
+        logger = BioRemPPLogger(log_dir=str(tmp_path))
+
+        logger.user_success("done", Details())
+        assert rendered == []
+        logger.close()
+
+        (log_file,) = tmp_path.glob("biorempp_*.log")
+        assert "USER_SUCCESS: done | Details: 3 files" in log_file.read_text(
+            encoding="utf-8"
+        )
+
+    def test_user_error_is_shown_when_silent(self, tmp_path, capsys):
+        """Test that errors are printed even in SILENT mode."""
+        logger = BioRemPPLogger("SILENT", log_dir=str(tmp_path))
+
+        logger.user_success("hidden")
+        logger.user_error("failed", "retry")
+        logger.close()
+
+        assert capsys.readouterr().out == "[ERROR] Error: failed\n💡 Solution:\nretry\n"
+
+
+class TestCachedRotatingFileHandler:
+    """Test suite for the size-tracking rotating file handler."""
+
+    def test_rolls_over_at_max_bytes(self, tmp_path):
+        """Test that files are rotated before exceeding maxBytes."""
+        log_file = tmp_path / "test.log"
+        handler = _CachedRotatingFileHandler(
+            log_file, maxBytes=200, backupCount=3, encoding="utf-8"
+        )
+        logger = logging.getLogger("biorempp.test_cached_rotation")
+        logger.propagate = False
+        logger.addHandler(handler)
+
+        try:
+            for i in range(60):
+                logger.warning("message %02d – ✅", i)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
+        files = sorted(tmp_path.glob("test.log*"))
+        assert len(files) == 4
+        assert all(f.stat().st_size <= 200 for f in files)
+        assert "message 59" in log_file.read_text(encoding="utf-8")
+
+
+class TestDropOldestQueueHandler:
+    """Test suite for the bounded technical log queue."""
+
+    def test_full_queue_keeps_newest_records(self):
+        """Test that the oldest records are dropped when the queue is full."""
+        log_queue = queue.Queue(maxsize=2)
+        handler = _DropOldestQueueHandler(log_queue)
+
+        for i in range(5):
+            handler.handle(logging.makeLogRecord({"msg": f"record {i}"}))
+
+        kept = [log_queue.get_nowait().getMessage() for _ in range(2)]
+        assert kept == ["record 3", "record 4"]
+        assert handler.dropped_count == 3
+
+
+class TestCachedTimeFormatter:
+    """Test suite for the timestamp-caching formatter."""
+
+    def test_matches_standard_formatter(self):
+        """Test that timestamps match logging.Formatter within and across seconds."""
+        standard = logging.Formatter("%(asctime)s | %(message)s")
+        cached = _CachedTimeFormatter("%(asctime)s | %(message)s")
+
+        for created in (1700000000.125, 1700000000.900, 1700000001.004):
+            record = logging.makeLogRecord({"msg": "message", "created": created})
+            record.msecs = (created - int(created)) * 1000
+
+            assert cached.format(record) == standard.format(record)
+
+
+class TestSpinner:
+    """Test suite for the console spinner."""
+
+    def test_stop_spinner_ends_thread_and_clears_line(self, tmp_path, capsys):
+        """Test that stopping the spinner ends its thread and clears the line."""
+        logger = BioRemPPLogger(log_dir=str(tmp_path))
+        logger._tty = True
+
+        logger.user_info("Working", icon="*", show_spinner=True)
+        logger._stop_spinner()
+
+        assert not logger._spinner_thread.is_alive()
+        output = capsys.readouterr().out
+        assert output.endswith("\r" + " " * len("* Working  ") + "\r")
+        logger.close()
+
+    def test_spinner_is_plain_line_without_tty(self, tmp_path, capsys):
+        """Test that redirected output gets a plain line and no thread."""
+        logger = BioRemPPLogger(log_dir=str(tmp_path))
+        logger._tty = False
+
+        logger.user_info("Working", icon="*", show_spinner=True)
+
+        assert logger._spinner_thread is None
+        assert capsys.readouterr().out == "* Working\n"
+        logger.close()
+
+
+class TestGlobalLogger:
+    """Test suite for the module-level logger instance."""
+
+    def test_concurrent_calls_share_one_logger(self, tmp_path, monkeypatch):
+        """Test that racing threads all receive the same logger."""
+        import biorempp.utils.enhanced_logging as enhanced_logging
+
+        monkeypatch.setattr(enhanced_logging, "_global_logger", None)
+        monkeypatch.chdir(tmp_path)
+        barrier = threading.Barrier(8)
+        loggers = []
+
+        def worker():
+            barrier.wait()
+            loggers.append(get_enhanced_logger())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(logger) for logger in loggers}) == 1
+        loggers[0].info("configured once")
+        assert len(logging.getLogger("biorempp.technical").handlers) == 1
+        loggers[0].close()
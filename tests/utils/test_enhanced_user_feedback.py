@@ -130,3 +130,60 @@ class TestFeedbackManagerIntegration:
                     except Exception:
                         # Unexpected errors should be investigated
                         pass  # For now, just ensure no crashes
+
+
+class TestFeedbackOutput:
+    """Test suite for the console output of EnhancedFeedbackManager."""
+
+    def test_database_processing_output(self, capsys):
+        """Test the lines printed for processed databases."""
+        manager = EnhancedFeedbackManager()
+        result = {
+            "biorempp": {"output_path": "out.txt", "matches": 7613, "filename": "B"},
+            "kegg": {"matches": 5},
+        }
+
+        manager.show_database_processing(result)
+
+        assert capsys.readouterr().out == (
+            "[PROCESS] Processing databases [1/4]:\n"
+            "   [DB] BioRemPP Database...      OK 7,613 matches -> B\n"
+            "\n"
+        )
+
+    @pytest.mark.parametrize("verbosity", ["NORMAL", "DEBUG"])
+    def test_each_block_is_written_once(self, verbosity):
+        """Test that every output block is a single stdout write."""
+        manager = EnhancedFeedbackManager(verbosity)
+        result = {
+            "biorempp": {"output_path": "a", "matches": 1, "filename": "A"},
+            "hadeg": {"output_path": "b", "matches": 2, "filename": "B"},
+        }
+
+        with patch("sys.stdout") as mock_stdout:
+            manager.show_header()
+            manager.show_input_loaded(3)
+            manager.show_database_processing(result)
+            manager.show_final_summary(result, 1.0)
+
+        assert mock_stdout.write.call_count == 4
+
+    def test_verbosity_is_case_insensitive(self, capsys):
+        """Test that lowercase verbosity names select SILENT and DEBUG output."""
+        EnhancedFeedbackManager("silent").show_header()
+        assert capsys.readouterr().out == ""
+
+        EnhancedFeedbackManager("debug").show_input_loaded(0)
+        assert "🔧 [DEBUG] Empty or minimal input detected" in capsys.readouterr().out
+
+    def test_changing_verbosity_updates_output(self, capsys):
+        """Test that assigning verbosity after construction takes effect."""
+        manager = EnhancedFeedbackManager()
+
+        manager.verbosity = "silent"
+        manager.show_header()
+        assert capsys.readouterr().out == ""
+
+        manager.verbosity = "DEBUG"
+        manager.show_header()
+        assert "🔧 [DEBUG] Verbosity level: DEBUG" in capsys.readouterr().out
@@ -151,66 +151,6 @@ class TestEnhancedErrorHandler:
             except Exception as e:
                 assert False, f"handle_error failed with context '{context}': {e}"
 
-    def test_determine_context_input_file(self):
-        """Test context determination for input files."""
-        handler = EnhancedErrorHandler()
-
-        context = handler._determine_context("input file error", "FileNotFoundError")
-        assert context == "input_file"
-
-        context = handler._determine_context(
-            "sample_data.txt missing", "FileNotFoundError"
-        )
-        assert context == "input_file"
-
-    def test_determine_context_database_file(self):
-        """Test context determination for database files."""
-        handler = EnhancedErrorHandler()
-
-        context = handler._determine_context(
-            "biorempp.csv not found", "FileNotFoundError"
-        )
-        assert context == "database_file"
-
-        context = handler._determine_context("kegg database error", "FileNotFoundError")
-        assert context == "database_file"
-
-    def test_determine_context_invalid_database(self):
-        """Test context determination for invalid database."""
-        handler = EnhancedErrorHandler()
-
-        context = handler._determine_context("biorempp invalid", "ValueError")
-        assert context == "invalid_database"
-
-    def test_determine_context_output_directory(self):
-        """Test context determination for output directory."""
-        handler = EnhancedErrorHandler()
-
-        context = handler._determine_context(
-            "output directory error", "PermissionError"
-        )
-        assert context == "output_dir"
-
-        context = handler._determine_context("results folder issue", "PermissionError")
-        assert context == "output_dir"
-
-    def test_determine_context_invalid_format(self):
-        """Test context determination for invalid format."""
-        handler = EnhancedErrorHandler()
-
-        context = handler._determine_context("invalid format detected", "ValueError")
-        assert context == "invalid_format"
-
-        context = handler._determine_context("format error in file", "ValueError")
-        assert context == "invalid_format"
-
-    def test_determine_context_general(self):
-        """Test context determination for general errors."""
-        handler = EnhancedErrorHandler()
-
-        context = handler._determine_context("random error message", "RuntimeError")
-        assert context == "general"
-
     def test_get_solution_info_existing(self):
         """Test getting solution info for existing contexts."""
         handler = EnhancedErrorHandler()
@@ -252,6 +192,19 @@ class TestEnhancedErrorHandler:
         assert "• Solution 2" in formatted
         assert "📚 Example:" not in formatted
 
+    def test_handle_error_uses_general_solution(self):
+        """Test that a 'general' solution entry is formatted for the user."""
+        handler = EnhancedErrorHandler()
+        runtime_entry = {
+            "general": {"message": "Runtime failure", "solutions": ["Retry"]}
+        }
+
+        with patch.dict(handler.ERROR_SOLUTIONS, {"RuntimeError": runtime_entry}):
+            message, solution = handler.handle_error(RuntimeError("boom"))
+
+        assert message == "Runtime failure"
+        assert solution == "   • Retry"
+
     def test_get_generic_solution_known_error(self):
         """Test getting generic solution for known error type."""
         handler = EnhancedErrorHandler()
@@ -446,6 +446,43 @@ class TestSaveDataframeOutput:
         expected_path = os.path.join(str(tmp_path), output_dir, filename)
         assert result_path == expected_path
 
+    def test_save_dataframe_output_creates_directory_once(self, tmp_path):
+        """
+        Test that repeated saves to one directory create it only once.
+        """
+        # Arrange
+        df = pd.DataFrame({"test": [1]})
+        output_dir = str(tmp_path / "repeated_output")
+
+        # Act
+        with patch(
+            "biorempp.utils.io_utils.os.makedirs", wraps=os.makedirs
+        ) as mock_makedirs:
+            for i in range(3):
+                save_dataframe_output(df, output_dir, f"out_{i}.txt")
+
+        # Assert
+        assert mock_makedirs.call_count == 1
+
+    def test_save_dataframe_output_recreates_removed_directory(self, tmp_path):
+        """
+        Test that a directory removed between two saves is created again.
+        """
+        # Arrange
+        df = pd.DataFrame({"test": [1]})
+        output_dir = str(tmp_path / "removed_output")
+        first_path = save_dataframe_output(df, output_dir, "first.txt")
+
+        # Remove the directory behind the cache's back
+        os.remove(first_path)
+        os.rmdir(output_dir)
+
+        # Act
+        result_path = save_dataframe_output(df, output_dir, "second.txt")
+
+        # Assert
+        assert os.path.exists(result_path)
+
 
 """
 Additional tests for io_utils module to improve coverage.
@@ -581,18 +618,34 @@ class TestGenerateTimestampedFilename:
 class TestEdgeCases:
     """Test suite for edge cases and error conditions."""
 
-    def test_save_dataframe_output_error_handling(self):
+    def test_save_dataframe_output_error_handling(self, tmp_path):
         """Test error handling in save_dataframe_output."""
         from biorempp.utils.io_utils import save_dataframe_output
 
         df = pd.DataFrame({"test": [1, 2, 3]})
+        output_dir = tmp_path / "test_dir"
 
         # Test with invalid output directory (permission error simulation)
         with patch("pandas.DataFrame.to_csv") as mock_to_csv:
             mock_to_csv.side_effect = PermissionError("Access denied")
 
             with pytest.raises(PermissionError):
-                save_dataframe_output(df, "test_dir", "test.csv")
+                save_dataframe_output(df, str(output_dir), "test.csv")
+
+        # The partially written file is removed
+        assert not (output_dir / "test.csv").exists()
+
+    def test_save_dataframe_output_infers_compression(self, tmp_path):
+        """Test that a compression suffix produces a compressed file."""
+        from biorempp.utils.io_utils import save_dataframe_output
+
+        df = pd.DataFrame({"ko": ["K00001", "K00002"]})
+
+        output_path = save_dataframe_output(df, str(tmp_path), "out.csv.gz")
+
+        with open(output_path, "rb") as f:
+            assert f.read(2) == b"\x1f\x8b"
+        pd.testing.assert_frame_equal(pd.read_csv(output_path, sep=";"), df)
 
     def test_resolve_output_path_edge_cases(self):
         """Test edge cases for resolve_output_path."""
@@ -635,3 +688,126 @@ class TestEdgeCases:
             # Verify that debug and info logging was called
             assert mock_logger.debug.called
             assert mock_logger.info.called
+
+
+class TestOutputCache:
+    """Test suite for the content-addressed output cache helpers."""
+
+    def test_cache_key_depends_on_content_and_database(self, tmp_path):
+        """Test that the key changes with input content and database mtime."""
+        from biorempp.utils.io_utils import compute_output_cache_key
+
+        db = tmp_path / "db.csv"
+        db.write_text("ko;name\nK00001;a\n", encoding="utf-8")
+
+        key = compute_output_cache_key(">s1\nK00001\n", [str(db)], "biorempp")
+        assert key == compute_output_cache_key(">s1\nK00001\n", [str(db)], "biorempp")
+        assert key != compute_output_cache_key(">s1\nK00002\n", [str(db)], "biorempp")
+        assert key != compute_output_cache_key(">s1\nK00001\n", [str(db)], "kegg")
+
+        stat = db.stat()
+        os.utime(db, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert key != compute_output_cache_key(">s1\nK00001\n", [str(db)], "biorempp")
+
+    def test_cache_key_depends_on_package_version(self, tmp_path, monkeypatch):
+        """Test that outputs of another BioRemPP version are not reused."""
+        import biorempp
+        from biorempp.utils.io_utils import compute_output_cache_key
+
+        db = tmp_path / "db.csv"
+        db.write_text("ko;cpd\n", encoding="utf-8")
+
+        key = compute_output_cache_key("content", [str(db)], "biorempp")
+        monkeypatch.setattr(biorempp, "__version__", "0.0.0-other")
+        assert key != compute_output_cache_key("content", [str(db)], "biorempp")
+
+    def test_cache_key_missing_database(self, tmp_path):
+        """Test that runs against missing databases are not cached."""
+        from biorempp.utils.io_utils import compute_output_cache_key
+
+        missing = str(tmp_path / "missing.csv")
+        assert compute_output_cache_key("content", [missing]) is None
+
+    def test_store_and_restore_cached_output(self, tmp_path):
+        """Test that a stored output is restored to the output directory."""
+        from biorempp.utils.io_utils import (
+            restore_cached_output,
+            store_cached_output,
+        )
+
+        output_dir = str(tmp_path / "results")
+        df = pd.DataFrame({"ko": ["K00001", "K00002"]})
+        output_path = save_dataframe_output(df, output_dir, "out.txt")
+
+        assert restore_cached_output("abc", output_dir, "out.txt") is None
+
+        store_cached_output("abc", output_dir, output_path, len(df))
+        os.remove(output_path)
+
+        restored_path, matches = restore_cached_output("abc", output_dir, "out.txt")
+        assert restored_path == output_path
+        assert matches == 2
+        assert pd.read_csv(restored_path, sep=";").equals(df)
+
+    def test_store_prunes_least_recently_used_entries(self, tmp_path, monkeypatch):
+        """Test that the cache keeps only the most recently used entries."""
+        from biorempp.utils import io_utils
+
+        monkeypatch.setattr(io_utils, "MAX_OUTPUT_CACHE_ENTRIES", 2)
+        output_dir = str(tmp_path / "results")
+        output_path = save_dataframe_output(pd.DataFrame({"a": [1]}), output_dir, "o")
+        cache_dir = os.path.join(output_dir, ".cache")
+
+        for i, key in enumerate(("first", "second")):
+            io_utils.store_cached_output(key, output_dir, output_path, 1)
+            entry = os.path.join(cache_dir, key)
+            os.utime(entry, ns=(i * 10**9, i * 10**9))
+
+        # Using "first" makes "second" the least recently used entry
+        assert io_utils.restore_cached_output("first", output_dir, "o") is not None
+        io_utils.store_cached_output("third", output_dir, output_path, 1)
+
+        assert sorted(os.listdir(cache_dir)) == ["first", "third"]
+
+
+class TestOutputFormats:
+    """Test suite for binary output formats of save_dataframe_output."""
+
+    def test_get_output_filename(self):
+        """Test that the extension follows the output format."""
+        from biorempp.utils.io_utils import get_output_filename
+
+        assert get_output_filename("results.txt") == "results.txt"
+        assert get_output_filename("results.txt", "parquet") == "results.parquet"
+        assert get_output_filename("results", "feather") == "results.feather"
+
+    def test_unsupported_output_format(self, tmp_path):
+        """Test that unknown formats are rejected."""
+        df = pd.DataFrame({"ko": ["K00001"]})
+
+        with pytest.raises(ValueError, match="Unsupported output format"):
+            save_dataframe_output(df, str(tmp_path), "out.txt", output_format="xlsx")
+
+    @pytest.mark.parametrize("output_format", ["parquet", "feather"])
+    def test_binary_output_formats(self, tmp_path, output_format):
+        """Test Parquet/Feather output, or the error when pyarrow is missing."""
+        df = pd.DataFrame(
+            {"ko": pd.Categorical(["K00001", "K00001", "K00002"]), "n": [1, 2, 3]}
+        )
+
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            with pytest.raises(ImportError, match="pyarrow is required"):
+                save_dataframe_output(
+                    df, str(tmp_path), "out.txt", output_format=output_format
+                )
+            return
+
+        output_path = save_dataframe_output(
+            df, str(tmp_path), "out.txt", output_format=output_format
+        )
+
+        assert output_path.endswith(f"out.{output_format}")
+        reader = pd.read_parquet if output_format == "parquet" else pd.read_feather
+        pd.testing.assert_frame_equal(reader(output_path), df, check_dtype=False)
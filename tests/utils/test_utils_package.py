@@ -0,0 +1,62 @@
+"""
+Unit tests for the biorempp.utils package namespace.
+
+Tests for the lazily imported public utilities.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import biorempp.utils
+
+
+class TestLazyExports:
+    """Test suite for the PEP 562 exports of biorempp.utils."""
+
+    @pytest.mark.parametrize("name", biorempp.utils.__all__)
+    def test_public_names_resolve(self, name):
+        """
+        Test that every name in __all__ resolves to its submodule object.
+        """
+        # Act
+        value = getattr(biorempp.utils, name)
+
+        # Assert
+        module_name, attr = biorempp.utils._LAZY_EXPORTS[name]
+        submodule = sys.modules[f"biorempp.utils.{module_name}"]
+        assert value is getattr(submodule, attr)
+        assert name in dir(biorempp.utils)
+
+    def test_unknown_name_raises_attribute_error(self):
+        """
+        Test that unknown names raise AttributeError.
+        """
+        with pytest.raises(AttributeError, match="no_such_utility"):
+            biorempp.utils.no_such_utility
+
+    def test_package_import_does_not_load_pandas(self):
+        """
+        Test that importing the package leaves pandas and the optional
+        utility modules unloaded.
+        """
+        # Arrange
+        code = (
+            "import sys, biorempp.utils; "
+            "print('pandas' in sys.modules, "
+            "'biorempp.utils.enhanced_user_feedback' in sys.modules)"
+        )
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        )
+
+        # Assert
+        assert result.stdout.split() == ["False", "False"]